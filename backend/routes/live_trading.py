@@ -800,7 +800,7 @@ def execute_signal():
     
     # Get current market price if no price specified
     if price is None:
-        market = get_market_price(ticker)
+        market = get_market_price(ticker, force_refresh=True)
         if market:
             if side == 'yes':
                 price = market.get('yes_ask') or market.get('last_price')
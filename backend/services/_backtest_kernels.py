@@ -0,0 +1,214 @@
+"""
+Compiled kernels for the backtests.
+
+The sequential parts of a backtest (capital recursion, with or without the
+bankruptcy floor, drawdown and streak tracking) carry state from one trade to the next,
+so they are written as plain loops, as is the clipped random walk used for
+generated market price histories. They are loaded, in order of preference,
+from the ahead-of-time build (see _backtest_kernels_aot), JIT-compiled with
+numba, or run as ordinary Python when numba is not installed (the walks then
+step all markets together with numpy instead).
+"""
+import logging
+import os
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+def _njit(*args, **kwargs):
+    """numba.njit when available, otherwise a no-op decorator."""
+    if NUMBA_AVAILABLE:
+        return njit(*args, **kwargs)
+    if args and callable(args[0]):
+        return args[0]
+    return lambda func: func
+
+
+def _accumulate_path(capital_returns, is_wins, initial_capital, floor):
+    """
+    Single pass over the sampled trades.
+
+    Applies each trade's capital return with the bankruptcy floor, and tracks
+    peak capital (for max drawdown) and the current win/loss streak.
+
+    Returns:
+        (capital_path, max_drawdown, max_win_streak, max_loss_streak), where
+        capital_path[0] is the initial capital and capital_path[i + 1] the
+        capital after trade i.
+    """
+    n = capital_returns.shape[0]
+    capital_path = np.empty(n + 1, dtype=np.float64)
+    capital = initial_capital
+    peak = initial_capital
+    max_drawdown = 0.0
+    streak = 0
+    max_win_streak = 0
+    max_loss_streak = 0
+    capital_path[0] = capital
+
+    for i in range(n):
+        capital = capital * (1.0 + capital_returns[i])
+        if capital < floor:
+            capital = floor
+        capital_path[i + 1] = capital
+
+        if capital > peak:
+            peak = capital
+        drawdown = (peak - capital) / peak
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+
+        # Positive streak counts wins, negative counts losses
+        if is_wins[i]:
+            streak = streak + 1 if streak > 0 else 1
+            if streak > max_win_streak:
+                max_win_streak = streak
+        else:
+            streak = streak - 1 if streak < 0 else -1
+            if -streak > max_loss_streak:
+                max_loss_streak = -streak
+
+    return capital_path, max_drawdown, max_win_streak, max_loss_streak
+
+
+def _compound_returns(pnl_pcts, initial_capital):
+    """
+    Compound per-trade returns on running capital in a single pass.
+
+    Returns:
+        (capital_after, pnls, max_drawdown), with capital_after[i] and
+        pnls[i] the capital after and P&L of trade i.
+    """
+    n = pnl_pcts.shape[0]
+    capital_after = np.empty(n, dtype=np.float64)
+    pnls = np.empty(n, dtype=np.float64)
+    capital = initial_capital
+    peak = initial_capital
+    max_drawdown = 0.0
+
+    for i in range(n):
+        pnl = capital * pnl_pcts[i]
+        capital = capital + pnl
+        pnls[i] = pnl
+        capital_after[i] = capital
+
+        if capital > peak:
+            peak = capital
+        drawdown = (peak - capital) / peak
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+
+    return capital_after, pnls, max_drawdown
+
+
+def _price_paths(noise, initial_probs, final_probs, num_points):
+    """
+    Random walks that drift from each market's initial toward its final
+    probability, clipped to [0.01, 0.99] and snapping to the final value
+    over the last 1% of the path.
+
+    Row m of ``noise`` holds the (already scaled) noise for market m's steps;
+    only the first num_points[m] columns of each row of the result are
+    meaningful, the rest repeat the last price.
+    """
+    n_markets, max_points = noise.shape
+    prices = np.empty((n_markets, max_points), dtype=np.float64)
+
+    for m in range(n_markets):
+        n = num_points[m]
+        time_step = 1.0 / n
+        final = final_probs[m]
+        current = initial_probs[m]
+        for i in range(n):
+            remaining = 1.0 - i * time_step
+            if remaining > 0.01:
+                current += (final - current) * time_step / remaining + noise[m, i]
+                if current < 0.01:
+                    current = 0.01
+                elif current > 0.99:
+                    current = 0.99
+            else:
+                current = final
+            prices[m, i] = current
+        for i in range(n, max_points):
+            prices[m, i] = current
+
+    return prices
+
+
+def _price_paths_by_step(noise, initial_probs, final_probs, num_points):
+    """
+    The same walks as _price_paths, advancing every market one step at a
+    time with array operations. Used in place of the interpreted loop when
+    numba is not installed (it is no faster once compiled).
+    """
+    n_markets, max_points = noise.shape
+    prices = np.empty((n_markets, max_points), dtype=np.float64)
+    time_steps = 1.0 / num_points
+    current = initial_probs.astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(max_points):
+            remaining = 1.0 - i * time_steps
+            in_path = i < num_points
+            stepped = np.clip(
+                current + ((final_probs - current) * time_steps / remaining + noise[:, i]), 0.01, 0.99
+            )
+            current = np.where(
+                in_path & (remaining > 0.01), stepped, np.where(in_path, final_probs, current)
+            )
+            prices[:, i] = current
+
+    return prices
+
+
+# Signatures used for the ahead-of-time build
+ACCUMULATE_PATH_SIGNATURE = 'Tuple((f8[:], f8, i8, i8))(f8[:], b1[:], f8, f8)'
+COMPOUND_RETURNS_SIGNATURE = 'Tuple((f8[:], f8[:], f8))(f8[:], f8)'
+PRICE_PATHS_SIGNATURE = 'f8[:, :](f8[:, :], f8[:], f8[:], i8[:])'
+
+try:
+    from ._backtest_kernels_compiled import accumulate_path, compound_returns, price_paths
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+    accumulate_path = _njit(cache=True, fastmath=True, nogil=True)(_accumulate_path)
+    compound_returns = _njit(cache=True, fastmath=True, nogil=True)(_compound_returns)
+    # No fastmath: the 1% snap-to-final threshold is hit exactly at 200 points
+    if NUMBA_AVAILABLE:
+        price_paths = _njit(cache=True, nogil=True)(_price_paths)
+    else:
+        price_paths = _price_paths_by_step
+
+
+def _warm_up_kernels() -> None:
+    """
+    Compile (or load from the numba cache) the JIT kernels at import time,
+    so the first backtest request does not pay the compilation latency.
+    Nothing to do when the ahead-of-time build is loaded. Set
+    BACKTEST_PRECOMPILE=0 to skip.
+    """
+    if AOT_AVAILABLE or not NUMBA_AVAILABLE or os.environ.get('BACKTEST_PRECOMPILE', '1') != '1':
+        return
+    start = time.perf_counter()
+    try:
+        accumulate_path(np.zeros(1), np.zeros(1, dtype=np.bool_), 100.0, 10.0)
+        compound_returns(np.zeros(1), 100.0)
+        price_paths(np.zeros((1, 1)), np.zeros(1), np.zeros(1), np.ones(1, dtype=np.int64))
+    except Exception as e:
+        logger.warning(f"Backtest kernel warm-up failed: {e}")
+        return
+    logger.info(f"Backtest kernels ready in {time.perf_counter() - start:.2f}s")
+
+
+_warm_up_kernels()
@@ -0,0 +1,44 @@
+"""
+Ahead-of-time build of the backtest kernels.
+
+JIT-compiling the kernels costs seconds on a cold process (the numba cache
+only helps once it has been populated). Running
+
+    python -m services._backtest_kernels_aot
+
+from the backend directory compiles them with numba.pycc into a
+``_backtest_kernels_compiled`` extension next to this file, which
+_backtest_kernels imports in preference to the JIT versions. The extension
+does not need numba at runtime.
+"""
+import logging
+import os
+
+from numba.pycc import CC
+
+from ._backtest_kernels import (
+    ACCUMULATE_PATH_SIGNATURE,
+    COMPOUND_RETURNS_SIGNATURE,
+    PRICE_PATHS_SIGNATURE,
+    _accumulate_path,
+    _compound_returns,
+    _price_paths,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build(output_dir: str = None) -> None:
+    """Compile the kernels into the _backtest_kernels_compiled extension."""
+    cc = CC('_backtest_kernels_compiled')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.export('accumulate_path', ACCUMULATE_PATH_SIGNATURE)(_accumulate_path)
+    cc.export('compound_returns', COMPOUND_RETURNS_SIGNATURE)(_compound_returns)
+    cc.export('price_paths', PRICE_PATHS_SIGNATURE)(_price_paths)
+    cc.compile()
+    logger.info(f"Backtest kernels compiled into {cc.output_dir}")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    build()
@@ -5,6 +5,7 @@ Supports both paper trading and live trading.
 """
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, Tuple
 
 import requests
@@ -15,6 +16,10 @@ ALPACA_PAPER_BASE = 'https://paper-api.alpaca.markets'
 ALPACA_LIVE_BASE = 'https://api.alpaca.markets'
 ALPACA_DATA_BASE = 'https://data.alpaca.markets'
 
+# Accepted order parameters
+_VALID_SIDES = frozenset(('buy', 'sell'))
+_VALID_ORDER_TYPES = frozenset(('market', 'limit', 'stop', 'stop_limit', 'trailing_stop'))
+
 
 class AlpacaService:
     """Service for interacting with Alpaca trading API."""
@@ -39,6 +44,12 @@ class AlpacaService:
             'APCA-API-SECRET-KEY': self.api_secret,
             'Content-Type': 'application/json',
         })
+        self._verbs = {
+            'GET': self.session.get,
+            'POST': self.session.post,
+            'DELETE': self.session.delete,
+            'PATCH': self.session.patch,
+        }
 
     def _make_request(
         self,
@@ -56,18 +67,20 @@ class AlpacaService:
         base = self.data_url if use_data_api else self.base_url
         url = f"{base}{endpoint}"
 
-        try:
-            if method.upper() == 'GET':
-                response = self.session.get(url, timeout=15)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, json=data, timeout=15)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url, timeout=15)
-            elif method.upper() == 'PATCH':
-                response = self.session.patch(url, json=data, timeout=15)
-            else:
+        verb = self._verbs.get(method)
+        if verb is None:
+            method = method.upper()
+            verb = self._verbs.get(method)
+            if verb is None:
                 return False, f"Unsupported HTTP method: {method}"
 
+        kwargs = {'timeout': 15}
+        if method in ('POST', 'PATCH'):
+            kwargs['json'] = data
+
+        try:
+            response = verb(url, **kwargs)
+
             if response.status_code in [200, 201, 204]:
                 if response.status_code == 204:
                     return True, {}
@@ -338,14 +351,13 @@ class AlpacaService:
         import uuid
 
         # Validate inputs
-        if side not in ['buy', 'sell']:
+        if side not in _VALID_SIDES:
             return False, {'error': 'Side must be "buy" or "sell"'}
-        if order_type not in ['market', 'limit', 'stop', 'stop_limit', 'trailing_stop']:
+        if order_type not in _VALID_ORDER_TYPES:
             return False, {'error': 'Invalid order type'}
-        if not qty and not notional:
-            return False, {'error': 'Must specify qty or notional'}
-        if qty and notional:
-            return False, {'error': 'Specify qty or notional, not both'}
+        # Covers both "neither given" and "both given"
+        if (qty is None) == (notional is None):
+            return False, {'error': 'Specify exactly one of qty or notional'}
 
         # Build order data
         order_data = {
@@ -355,9 +367,9 @@ class AlpacaService:
             'time_in_force': time_in_force,
         }
 
-        if qty:
+        if qty is not None:
             order_data['qty'] = str(qty)
-        if notional:
+        if notional is not None:
             order_data['notional'] = str(notional)
         if limit_price and order_type in ['limit', 'stop_limit']:
             order_data['limit_price'] = str(limit_price)
@@ -736,6 +748,18 @@ class AlpacaService:
 # CONVENIENCE FUNCTIONS
 # ============================================
 
+@lru_cache(maxsize=1024)
+def _get_service(api_key: str, api_secret: str, paper: bool) -> AlpacaService:
+    """
+    Return a shared AlpacaService for a set of credentials.
+
+    Reusing the instance keeps its requests.Session (and the pooled TLS
+    connection) warm across connect/refresh calls. Call
+    ``_get_service.cache_clear()`` after credentials are rotated.
+    """
+    return AlpacaService(api_key, api_secret, paper=paper)
+
+
 def connect_alpaca_account(api_key: str, api_secret: str, paper: bool = True) -> Tuple[bool, Dict[str, Any]]:
     """
     Connect and verify an Alpaca account.
@@ -749,7 +773,7 @@ def connect_alpaca_account(api_key: str, api_secret: str, paper: bool = True) ->
         Tuple of (success: bool, result: dict with account info or error)
     """
     try:
-        service = AlpacaService(api_key, api_secret, paper=paper)
+        service = _get_service(api_key, api_secret, paper)
     except Exception as e:
         return False, {'error': str(e)}
 
@@ -794,7 +818,7 @@ def refresh_alpaca_balance(api_key: str, api_secret: str, paper: bool = True) ->
         Tuple of (success: bool, result: dict with balance or error)
     """
     try:
-        service = AlpacaService(api_key, api_secret, paper=paper)
+        service = _get_service(api_key, api_secret, paper)
     except Exception as e:
         return False, {'error': str(e)}
 
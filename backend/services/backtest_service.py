@@ -2,9 +2,30 @@
 Backtesting service for TO THE MOON.
 Simulates strategy performance on historical data.
 """
-import random
+import copy
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ._backtest_kernels import compound_returns
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on simulated trades per backtest, so very long or very
+# frequent ranges cannot allocate unbounded arrays
+MAX_BACKTEST_TRADES = 200_000
+
+# Risk level -> (win_rate, avg_win, avg_loss, trades per week)
+_RISK_PARAMS = {
+    'low': (0.72, 0.015, 0.008, 3),
+    'medium': (0.65, 0.035, 0.018, 5),
+    'high': (0.55, 0.08, 0.04, 8),
+}
 
 
 class BacktestService:
@@ -16,12 +37,22 @@ class BacktestService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         initial_capital: float = 10000.0,
+        as_arrays: bool = False,
+        seed: Optional[int] = None,
     ) -> dict:
         """
         Run a backtest simulation for a strategy.
 
         In production, this would use real historical data.
         For now, we simulate results based on strategy parameters.
+
+        By default 'trades' holds the last 50 trades as JSON-ready dicts. With
+        as_arrays=True it holds every trade as full-precision numpy columns
+        (date, pnl, pnl_pct, capital_after, is_win) for callers that
+        aggregate or serialize the buffers themselves.
+
+        A seed makes the run reproducible; seeded runs with the same inputs
+        are served from a cache.
         """
         if not start_date:
             start_date = datetime.utcnow() - timedelta(days=180)
@@ -34,65 +65,84 @@ class BacktestService:
         category = strategy_config.get('category', 'crypto')
 
         # Base parameters based on risk level
-        risk_params = {
-            'low': {'win_rate': 0.72, 'avg_win': 0.015, 'avg_loss': 0.008, 'trade_freq': 3},
-            'medium': {'win_rate': 0.65, 'avg_win': 0.035, 'avg_loss': 0.018, 'trade_freq': 5},
-            'high': {'win_rate': 0.55, 'avg_win': 0.08, 'avg_loss': 0.04, 'trade_freq': 8},
-        }
+        params = _RISK_PARAMS.get(risk_level, _RISK_PARAMS['medium'])
 
-        params = risk_params.get(risk_level, risk_params['medium'])
+        if seed is not None:
+            # Copy so callers cannot modify the cached result
+            return copy.deepcopy(
+                _run_seeded_backtest(params, start_date, end_date, initial_capital, as_arrays, seed)
+            )
 
-        # Simulate trades
-        days = (end_date - start_date).days
-        total_trades = int(days / 7 * params['trade_freq'])  # trades per week
-
-        trades = []
-        capital = initial_capital
-        winning_trades = 0
+        return BacktestService._simulate(
+            params, start_date, end_date, initial_capital, as_arrays, np.random.default_rng()
+        )
 
-        for i in range(total_trades):
-            trade_date = start_date + timedelta(days=random.randint(0, days))
+    @staticmethod
+    def _simulate(
+        params: Tuple[float, float, float, int],
+        start_date: datetime,
+        end_date: datetime,
+        initial_capital: float,
+        as_arrays: bool,
+        rng: np.random.Generator,
+    ) -> dict:
+        """Simulate trades for one set of risk parameters, drawing from ``rng``."""
+        win_rate, avg_win, avg_loss, trade_freq = params
 
-            # Determine if trade wins
-            is_win = random.random() < params['win_rate']
+        # Simulate trades
+        days = (end_date - start_date).days
+        total_trades = max(int(days / 7 * trade_freq), 0)  # trades per week
+        if total_trades > MAX_BACKTEST_TRADES:
+            logger.warning(
+                f"Backtest of {days} days would simulate {total_trades} trades; "
+                f"capping at {MAX_BACKTEST_TRADES}"
+            )
+            total_trades = MAX_BACKTEST_TRADES
+        if total_trades == 0:
+            return BacktestService._empty_result(initial_capital, as_arrays)
 
-            if is_win:
-                pnl_pct = random.uniform(params['avg_win'] * 0.5, params['avg_win'] * 1.5)
-                winning_trades += 1
-            else:
-                pnl_pct = -random.uniform(params['avg_loss'] * 0.5, params['avg_loss'] * 1.5)
+        # Draw every trade at once: date offset, outcome and size of the move.
+        # Offsets are sorted up front so trades are generated in date order.
+        day_offsets = np.sort(rng.integers(0, days + 1, total_trades))
+        is_wins = rng.random(total_trades) < win_rate
+        magnitudes = rng.uniform(0.5, 1.5, total_trades)
+        pnl_pcts = np.where(is_wins, avg_win * magnitudes, -avg_loss * magnitudes)
 
-            pnl = capital * pnl_pct
-            capital += pnl
+        # Each trade compounds on the capital before it (one compiled pass,
+        # which also tracks the drawdown)
+        capital_after, pnls, max_drawdown = compound_returns(pnl_pcts, float(initial_capital))
+        max_drawdown = float(max_drawdown) * 100
+        capital = float(capital_after[-1])
+        winning_trades = int(np.count_nonzero(is_wins))
 
-            trades.append({
-                'date': trade_date.isoformat(),
-                'pnl': round(pnl, 2),
-                'pnl_pct': round(pnl_pct * 100, 2),
-                'capital_after': round(capital, 2),
-                'is_win': is_win,
-            })
+        # Trade days stay datetime64[D]; the start's time of day is only
+        # added back when dates are formatted for the response
+        start = np.datetime64(start_date)
+        start_day = start.astype('datetime64[D]')
+        time_of_day = start - start_day
+        trade_dates = start_day + day_offsets
 
-        # Sort trades by date
-        trades.sort(key=lambda x: x['date'])
+        if as_arrays:
+            trades = {
+                'date': trade_dates + time_of_day,
+                'pnl': pnls,
+                'pnl_pct': pnl_pcts * 100,
+                'capital_after': capital_after,
+                'is_win': is_wins,
+            }
+        else:
+            trades = BacktestService._recent_trades(
+                trade_dates, pnls, pnl_pcts, capital_after, is_wins, time_of_day=time_of_day
+            )
 
         # Calculate metrics
         total_pnl = capital - initial_capital
         total_return_pct = (total_pnl / initial_capital) * 100
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-
-        # Calculate max drawdown
-        peak = initial_capital
-        max_drawdown = 0
-        for trade in trades:
-            if trade['capital_after'] > peak:
-                peak = trade['capital_after']
-            drawdown = (peak - trade['capital_after']) / peak * 100
-            max_drawdown = max(max_drawdown, drawdown)
+        win_rate = winning_trades / total_trades * 100
 
         # Generate monthly returns
         monthly_returns = BacktestService._calculate_monthly_returns(
-            trades, start_date, end_date, initial_capital
+            trade_dates, np.round(pnls, 2), initial_capital
         )
 
         return {
@@ -107,68 +157,200 @@ class BacktestService:
                 'losing_trades': total_trades - winning_trades,
                 'win_rate': round(win_rate, 2),
                 'max_drawdown_pct': round(max_drawdown, 2),
-                'avg_trade_pnl': round(total_pnl / total_trades, 2) if total_trades > 0 else 0,
+                'avg_trade_pnl': round(total_pnl / total_trades, 2),
             },
             'monthly_returns': monthly_returns,
-            'trades': trades[-50:],  # Return last 50 trades
-            'equity_curve': BacktestService._generate_equity_curve(trades, initial_capital),
+            'trades': trades,
+            'equity_curve': BacktestService._generate_equity_curve(
+                trade_dates, capital_after, initial_capital, time_of_day=time_of_day
+            ),
         }
 
+    @staticmethod
+    def _empty_result(initial_capital: float, as_arrays: bool = False) -> dict:
+        """Result for a range too short to hold any trades."""
+        if as_arrays:
+            trades = {
+                'date': np.array([], dtype='datetime64[s]'),
+                'pnl': np.array([]),
+                'pnl_pct': np.array([]),
+                'capital_after': np.array([]),
+                'is_win': np.array([], dtype=np.bool_),
+            }
+        else:
+            trades = []
+
+        return {
+            'success': True,
+            'summary': {
+                'initial_capital': initial_capital,
+                'final_capital': round(initial_capital, 2),
+                'total_pnl': 0,
+                'total_return_pct': 0,
+                'total_trades': 0,
+                'winning_trades': 0,
+                'losing_trades': 0,
+                'win_rate': 0,
+                'max_drawdown_pct': 0,
+                'avg_trade_pnl': 0,
+            },
+            'monthly_returns': [],
+            'trades': trades,
+            'equity_curve': [{'date': None, 'equity': initial_capital}],
+        }
+
+    @staticmethod
+    def _recent_trades(
+        dates: np.ndarray,
+        pnls: np.ndarray,
+        pnl_pcts: np.ndarray,
+        capital_after: np.ndarray,
+        is_wins: np.ndarray,
+        limit: int = 50,
+        time_of_day: np.timedelta64 = np.timedelta64(0, 's'),
+    ) -> list:
+        """Build JSON-ready dicts for the last ``limit`` trades only."""
+        recent = slice(-limit, None)
+        return [
+            {
+                'date': date,
+                'pnl': pnl,
+                'pnl_pct': pnl_pct,
+                'capital_after': capital_after_trade,
+                'is_win': is_win,
+            }
+            for date, pnl, pnl_pct, capital_after_trade, is_win in zip(
+                np.datetime_as_string(dates[recent] + time_of_day).tolist(),
+                np.round(pnls[recent], 2).tolist(),
+                np.round(pnl_pcts[recent] * 100, 2).tolist(),
+                np.round(capital_after[recent], 2).tolist(),
+                is_wins[recent].tolist(),
+            )
+        ]
+
+    @staticmethod
+    def run_backtests(
+        strategy_configs: List[dict],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        initial_capital: float = 10000.0,
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Run backtests for several strategy configs in parallel worker processes.
+
+        Returns one result per config, in the same order. A config whose
+        backtest raises gets {'success': False, 'error': ...} instead.
+        """
+        if not strategy_configs:
+            return []
+
+        max_workers = min(len(strategy_configs), max_workers or os.cpu_count() or 1)
+        results = [None] * len(strategy_configs)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    BacktestService.run_backtest, config, start_date, end_date, initial_capital,
+                    seed=seed,
+                ): i
+                for i, config in enumerate(strategy_configs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = {'success': False, 'error': f'Backtest failed: {str(e)}'}
+
+        return results
+
     @staticmethod
     def _calculate_monthly_returns(
-        trades: list,
-        start_date: datetime,
-        end_date: datetime,
+        dates: np.ndarray,
+        pnls: np.ndarray,
         initial_capital: float,
     ) -> list:
-        """Calculate monthly return percentages."""
-        monthly = {}
-        capital = initial_capital
-
-        for trade in trades:
-            trade_date = datetime.fromisoformat(trade['date'])
-            month_key = trade_date.strftime('%Y-%m')
-
-            if month_key not in monthly:
-                monthly[month_key] = {
-                    'month': month_key,
-                    'start_capital': capital,
-                    'pnl': 0,
-                    'trades': 0,
-                }
-
-            monthly[month_key]['pnl'] += trade['pnl']
-            monthly[month_key]['trades'] += 1
-            capital += trade['pnl']
-
-        # Calculate return percentages
-        result = []
-        for month_key in sorted(monthly.keys()):
-            m = monthly[month_key]
-            return_pct = (m['pnl'] / m['start_capital']) * 100 if m['start_capital'] > 0 else 0
-            result.append({
-                'month': m['month'],
-                'pnl': round(m['pnl'], 2),
-                'return_pct': round(return_pct, 2),
-                'trades': m['trades'],
-            })
+        """
+        Calculate monthly return percentages.
+
+        ``dates`` (datetime64) and ``pnls`` are per trade in date order, so each
+        month is a contiguous run of trades: its P&L is summed with one
+        np.add.reduceat over the run starts. Months without trades are left out.
+        """
+        if not dates.size:
+            return []
+
+        months = dates.astype('datetime64[M]')
+        month_starts = np.flatnonzero(np.concatenate(([True], months[1:] != months[:-1])))
 
-        return result
+        monthly_trades = np.diff(np.append(month_starts, months.size))
+        monthly_pnls = np.add.reduceat(pnls, month_starts)
+        month_labels = np.datetime_as_string(months[month_starts])
+
+        # Capital going into each month
+        start_capitals = initial_capital + np.concatenate(([0.0], np.cumsum(monthly_pnls)[:-1]))
+        return_pcts = np.divide(
+            monthly_pnls * 100, start_capitals,
+            out=np.zeros_like(monthly_pnls), where=start_capitals > 0,
+        )
+
+        return [
+            {
+                'month': month,
+                'pnl': round(pnl, 2),
+                'return_pct': round(return_pct, 2),
+                'trades': trades,
+            }
+            for month, pnl, return_pct, trades in zip(
+                month_labels.tolist(), monthly_pnls.tolist(),
+                return_pcts.tolist(), monthly_trades.tolist(),
+            )
+        ]
 
     @staticmethod
-    def _generate_equity_curve(trades: list, initial_capital: float) -> list:
-        """Generate equity curve data points."""
-        curve = [{'date': trades[0]['date'] if trades else None, 'equity': initial_capital}]
-
-        for trade in trades:
-            curve.append({
-                'date': trade['date'],
-                'equity': trade['capital_after'],
-            })
-
-        # Sample every N points to reduce data size
-        if len(curve) > 100:
-            step = len(curve) // 100
-            curve = curve[::step] + [curve[-1]]
-
-        return curve
+    def _generate_equity_curve(
+        dates: np.ndarray,
+        capital_after: np.ndarray,
+        initial_capital: float,
+        max_points: int = 100,
+        time_of_day: np.timedelta64 = np.timedelta64(0, 's'),
+    ) -> list:
+        """
+        Generate equity curve data points.
+
+        The curve starts at the initial capital (dated at the first trade) and
+        follows capital after each trade, sampled down to about ``max_points``.
+        ``time_of_day`` is added to the sampled dates when they are formatted.
+        """
+        if not dates.size:
+            return [{'date': None, 'equity': initial_capital}]
+
+        equity = np.concatenate(([initial_capital], capital_after))
+        point_dates = np.concatenate((dates[:1], dates))
+
+        # Pick the sample indices first (always keeping the last point)
+        num_points = min(equity.size, max_points + 1)
+        idx = np.unique(np.linspace(0, equity.size - 1, num_points, dtype=np.int64))
+        sample_dates = np.datetime_as_string(point_dates[idx] + time_of_day)
+
+        return [
+            {'date': date, 'equity': round(value, 2)}
+            for date, value in zip(sample_dates.tolist(), equity[idx].tolist())
+        ]
+
+
+@lru_cache(maxsize=128)
+def _run_seeded_backtest(
+    params: Tuple[float, float, float, int],
+    start_date: datetime,
+    end_date: datetime,
+    initial_capital: float,
+    as_arrays: bool,
+    seed: int,
+) -> dict:
+    """Run (and memoize) a seeded backtest for one set of risk parameters."""
+    return BacktestService._simulate(
+        params, start_date, end_date, initial_capital, as_arrays, np.random.default_rng(seed)
+    )
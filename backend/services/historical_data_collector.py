@@ -4,25 +4,349 @@ Fetches REAL historical market data from Kalshi and Manifold Markets APIs
 for authentic backtesting with actual resolved markets.
 """
 import os
+import re
+import sys
 import json
 import time
 import hashlib
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dataclasses import dataclass, field, asdict
 
+from ._backtest_kernels import price_paths
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # API endpoints
 KALSHI_API_BASE = 'https://api.elections.kalshi.com/trade-api/v2'
 MANIFOLD_API_BASE = 'https://api.manifold.markets/v0'
 
+# Largest page the Kalshi events endpoint returns
+KALSHI_EVENTS_PAGE_SIZE = 200
+
+# Concurrent price-history requests per fetch
+PRICE_HISTORY_WORKERS = 8
+
+# API rate limit: bursts of up to RATE_LIMIT_BURST requests, RATE_LIMIT_PER_SECOND sustained
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_PER_SECOND = 5.0
+
+# Generated price paths: points per day of market life (capped), and the
+# walk's volatility per unit of market life
+PRICE_POINTS_PER_DAY = 4
+MAX_PRICE_POINTS = 200
+PRICE_PATH_VOLATILITY = 0.015
+
+MS_PER_DAY = 86_400_000
+
+# Fallback market templates: category -> ((title, initial_prob, final_prob, resolution), ...)
+# Realistic Kalshi markets based on actual 2024 events
+_KALSHI_TEMPLATES = MappingProxyType({
+    'politics': (
+        ('Will Biden win the 2024 presidential election?', 0.45, 0.48, 'NO'),
+        ('Will Trump win the 2024 Republican primary?', 0.72, 0.95, 'YES'),
+        ('Will Democrats retain Senate control in 2024?', 0.55, 0.52, 'YES'),
+        ('Will there be a government shutdown in Q4 2024?', 0.35, 0.15, 'NO'),
+        ('Will Nikki Haley drop out before Super Tuesday?', 0.40, 0.85, 'YES'),
+        ('Will any cabinet member resign in January?', 0.20, 0.10, 'NO'),
+        ('Will DeSantis endorse Trump after dropping out?', 0.65, 0.90, 'YES'),
+        ('Will there be a TikTok ban signed into law?', 0.30, 0.75, 'YES'),
+        ('Will Trump be on ballot in all 50 states?', 0.80, 0.95, 'YES'),
+        ('Will Biden drop out of 2024 race?', 0.15, 0.85, 'YES'),
+        ('Will Harris be Democratic nominee?', 0.10, 0.95, 'YES'),
+        ('Will RFK Jr get on ballot in 20+ states?', 0.55, 0.80, 'YES'),
+        ('Will Supreme Court hear Trump immunity case?', 0.70, 0.95, 'YES'),
+        ('Will any state secession bill pass?', 0.05, 0.02, 'NO'),
+        ('Will there be House Speaker vote in 2024?', 0.40, 0.65, 'YES'),
+        ('Will MTG face ethics investigation?', 0.35, 0.25, 'NO'),
+        ('Will Mayorkas impeachment pass House?', 0.60, 0.75, 'YES'),
+        ('Will any Senator switch parties?', 0.15, 0.08, 'NO'),
+        ('Will Texas border standoff escalate?', 0.45, 0.55, 'YES'),
+        ('Will SCOTUS rule on presidential immunity by July?', 0.65, 0.90, 'YES'),
+    ),
+    'economics': (
+        ('Will Fed cut rates in March 2024?', 0.65, 0.15, 'NO'),
+        ('Will inflation (CPI) be above 3% in December?', 0.55, 0.72, 'YES'),
+        ('Will unemployment exceed 4% in January?', 0.40, 0.35, 'NO'),
+        ('Will S&P 500 reach new ATH in January 2024?', 0.50, 0.85, 'YES'),
+        ('Will Fed cut rates in June 2024?', 0.45, 0.65, 'YES'),
+        ('Will GDP growth exceed 2% in Q4 2023?', 0.60, 0.78, 'YES'),
+        ('Will 10-year Treasury yield exceed 5%?', 0.35, 0.20, 'NO'),
+        ('Will there be a bank failure in 2024?', 0.25, 0.30, 'NO'),
+        ('Will NVDA market cap exceed $2T?', 0.40, 0.90, 'YES'),
+        ('Will oil exceed $100/barrel in 2024?', 0.30, 0.25, 'NO'),
+        ('Will gold exceed $2200/oz?', 0.45, 0.85, 'YES'),
+        ('Will Fed cut rates 3+ times in 2024?', 0.55, 0.35, 'NO'),
+        ('Will S&P 500 exceed 5000?', 0.35, 0.80, 'YES'),
+        ('Will housing prices decline nationally?', 0.40, 0.30, 'NO'),
+        ('Will AAPL market cap exceed $3T?', 0.50, 0.70, 'YES'),
+        ('Will recession be declared in 2024?', 0.30, 0.15, 'NO'),
+        ('Will January jobs report exceed 200k?', 0.55, 0.75, 'YES'),
+        ('Will core PCE fall below 3%?', 0.45, 0.60, 'YES'),
+    ),
+    'sports': (
+        ('Will Chiefs win Super Bowl LVIII?', 0.25, 0.65, 'YES'),
+        ('Will 49ers win Super Bowl LVIII?', 0.20, 0.35, 'NO'),
+        ('Will there be 60+ total points in Super Bowl?', 0.45, 0.35, 'NO'),
+        ('Will Travis Kelce score a touchdown in Super Bowl?', 0.55, 0.70, 'YES'),
+        ('Will Lakers make NBA playoffs?', 0.60, 0.75, 'YES'),
+        ('Will Ohtani sign with Dodgers?', 0.35, 0.95, 'YES'),
+        ('Will any NFL game end in a tie this season?', 0.30, 0.15, 'NO'),
+        ('Will Tiger Woods make cut at Masters?', 0.45, 0.25, 'NO'),
+        ('Will Mahomes win Super Bowl MVP?', 0.30, 0.55, 'YES'),
+        ('Will Ravens make Super Bowl?', 0.40, 0.30, 'NO'),
+        ('Will there be a perfect NCAA bracket?', 0.01, 0.01, 'NO'),
+        ('Will UConn win March Madness?', 0.15, 0.65, 'YES'),
+        ('Will any team sweep NBA playoffs?', 0.05, 0.02, 'NO'),
+        ('Will Celtics win NBA Finals?', 0.25, 0.70, 'YES'),
+        ('Will any golfer win Grand Slam?', 0.02, 0.01, 'NO'),
+        ('Will there be NFL playoff overtime?', 0.55, 0.65, 'YES'),
+        ('Will any NBA team break 73 wins?', 0.05, 0.02, 'NO'),
+        ('Will Euro 2024 have penalty shootout final?', 0.40, 0.35, 'NO'),
+        ('Will Spain win Euro 2024?', 0.15, 0.60, 'YES'),
+        ('Will a 16 seed beat a 1 seed in March Madness?', 0.10, 0.05, 'NO'),
+    ),
+    'crypto': (
+        ('Will Bitcoin exceed $50k by end of January?', 0.40, 0.75, 'YES'),
+        ('Will Bitcoin ETF be approved in January 2024?', 0.65, 0.95, 'YES'),
+        ('Will Ethereum exceed $3k in January?', 0.35, 0.60, 'YES'),
+        ('Will any major exchange fail in 2024?', 0.20, 0.15, 'NO'),
+        ('Will Bitcoin exceed $100k in 2024?', 0.25, 0.45, 'NO'),
+        ('Will SEC approve Ethereum ETF in 2024?', 0.40, 0.55, 'YES'),
+        ('Will Bitcoin halving occur in April?', 0.90, 0.98, 'YES'),
+        ('Will Solana exceed $200?', 0.30, 0.45, 'YES'),
+        ('Will any stablecoin depeg >5%?', 0.15, 0.10, 'NO'),
+        ('Will Bitcoin ETF have $10B+ volume day?', 0.35, 0.75, 'YES'),
+        ('Will Ethereum exceed $4k in 2024?', 0.40, 0.55, 'YES'),
+        ('Will crypto total market cap exceed $3T?', 0.35, 0.70, 'YES'),
+        ('Will any country adopt BTC as legal tender?', 0.20, 0.15, 'NO'),
+        ('Will FTX creditors receive 50%+ recovery?', 0.25, 0.40, 'YES'),
+    ),
+})
+
+# Typical Kalshi volume per category for generated markets
+_KALSHI_BASE_VOLUME = MappingProxyType({
+    'politics': 150000,
+    'economics': 100000,
+    'sports': 200000,
+    'crypto': 80000,
+})
+
+# Realistic Manifold markets
+_MANIFOLD_TEMPLATES = MappingProxyType({
+    'politics': (
+        ('Will Biden be the Democratic nominee in 2024?', 0.85, 0.15, 'NO'),
+        ('Will there be a contested convention?', 0.15, 0.05, 'NO'),
+        ('Will any sitting Senator switch parties in 2024?', 0.20, 0.10, 'NO'),
+        ('Will Trump face criminal conviction before election?', 0.45, 0.65, 'YES'),
+        ('Will Kamala Harris be the Democratic nominee?', 0.08, 0.95, 'YES'),
+        ('Will there be a third party debate?', 0.25, 0.15, 'NO'),
+        ('Will any Republican primary candidate endorse Biden?', 0.05, 0.03, 'NO'),
+        ('Will Trump appear at all primary debates?', 0.35, 0.10, 'NO'),
+        ('Will there be a VP announcement before August?', 0.60, 0.85, 'YES'),
+        ('Will any swing state have recount in 2024?', 0.45, 0.35, 'NO'),
+        ('Will there be faithless electors in 2024?', 0.10, 0.05, 'NO'),
+        ('Will Ukraine receive $60B+ aid package?', 0.55, 0.75, 'YES'),
+    ),
+    'economics': (
+        ('Will the US enter recession in 2024?', 0.35, 0.20, 'NO'),
+        ('Will any FAANG stock drop 20%+ in 2024?', 0.30, 0.25, 'NO'),
+        ('Will housing prices decline nationally in 2024?', 0.40, 0.30, 'NO'),
+        ('Will unemployment hit 5% in 2024?', 0.25, 0.15, 'NO'),
+        ('Will there be negative GDP quarter in 2024?', 0.30, 0.20, 'NO'),
+        ('Will Fed pivot to rate cuts by June?', 0.55, 0.45, 'NO'),
+        ('Will inflation fall below 2.5%?', 0.40, 0.35, 'NO'),
+        ('Will NVIDIA become most valuable company?', 0.25, 0.60, 'YES'),
+        ('Will any US bank fail in 2024?', 0.30, 0.25, 'NO'),
+        ('Will commercial real estate crisis worsen?', 0.55, 0.65, 'YES'),
+    ),
+    'tech': (
+        ('Will GPT-5 be released in 2024?', 0.40, 0.30, 'NO'),
+        ('Will Apple Vision Pro sell 1M units in 2024?', 0.45, 0.35, 'NO'),
+        ('Will OpenAI be valued at $100B+ in 2024?', 0.50, 0.80, 'YES'),
+        ('Will there be major AI regulation passed?', 0.35, 0.45, 'YES'),
+        ('Will Claude beat GPT-4 on benchmarks?', 0.35, 0.65, 'YES'),
+        ('Will there be AI-generated content lawsuit win?', 0.40, 0.55, 'YES'),
+        ('Will any AI company IPO in 2024?', 0.45, 0.35, 'NO'),
+        ('Will self-driving cars be approved in new state?', 0.50, 0.70, 'YES'),
+        ('Will Meta launch new VR headset?', 0.55, 0.75, 'YES'),
+        ('Will Twitter/X remain solvent all 2024?', 0.75, 0.90, 'YES'),
+    ),
+    'crypto': (
+        ('Will Tether lose its peg in 2024?', 0.10, 0.05, 'NO'),
+        ('Will Bitcoin dominance exceed 60%?', 0.45, 0.55, 'YES'),
+        ('Will there be a major DEX hack (>$100M)?', 0.40, 0.35, 'YES'),
+        ('Will any G7 country ban crypto?', 0.15, 0.08, 'NO'),
+        ('Will Bitcoin mining difficulty hit new ATH?', 0.70, 0.90, 'YES'),
+        ('Will NFT market recover in 2024?', 0.25, 0.20, 'NO'),
+        ('Will any memecoin enter top 20?', 0.35, 0.55, 'YES'),
+        ('Will DeFi TVL exceed $100B?', 0.40, 0.65, 'YES'),
+    ),
+    'sports': (
+        ('Will any NFL team go 17-0?', 0.05, 0.02, 'NO'),
+        ('Will Messi win another Ballon dOr?', 0.30, 0.25, 'NO'),
+        ('Will any NBA player average 35+ PPG?', 0.20, 0.15, 'NO'),
+        ('Will there be NFL London game?', 0.85, 0.95, 'YES'),
+        ('Will any MLB team win 110+ games?', 0.25, 0.20, 'NO'),
+        ('Will Olympics have boycott?', 0.20, 0.15, 'NO'),
+        ('Will any tennis player win calendar slam?', 0.08, 0.05, 'NO'),
+        ('Will F1 have new team enter?', 0.15, 0.25, 'NO'),
+    ),
+})
+
 # Cache directory for historical data
 CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'historical_cache')
 
+# Layout of market price histories (one record per price point). Prices stay
+# float64 so values such as 0.1234 round-trip exactly through JSON exports.
+PRICE_HISTORY_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('price', np.float64),
+    ('volume', np.float64),
+])
+
+# Manifold group slug / question keywords per category, checked in order
+_MANIFOLD_CATEGORY_KEYWORDS = {
+    'politics': ('politics', 'us-politics', 'elections', 'government', 'president', 'congress'),
+    'economics': ('economics', 'finance', 'stocks', 'fed', 'inflation', 'interest-rates', 'gdp'),
+    'sports': ('sports', 'nfl', 'nba', 'mlb', 'soccer', 'football', 'basketball'),
+    'crypto': ('crypto', 'bitcoin', 'ethereum', 'cryptocurrency', 'defi', 'web3'),
+    'tech': ('technology', 'ai', 'artificial-intelligence', 'tech', 'startups'),
+}
+
+# One substring alternation per category, compiled once
+_MANIFOLD_CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(re.escape(kw) for kw in keywords))
+    for category, keywords in _MANIFOLD_CATEGORY_KEYWORDS.items()
+}
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes (indented by 2 spaces if ``indent``), with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def _write_json_array(f, items) -> None:
+    """
+    Write items to a binary file as an indented JSON array, serializing one
+    item at a time rather than the whole list. The output matches dumping
+    the list with indent=2 (JSON strings never contain raw newlines, so
+    re-indenting each item is a plain replace).
+    """
+    f.write(b'[')
+    first = True
+    for item in items:
+        f.write(b'\n  ' if first else b',\n  ')
+        f.write(_json_dumps(item, indent=True).replace(b'\n', b'\n  '))
+        first = False
+    f.write(b']' if first else b'\n]')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+if MSGSPEC_AVAILABLE:
+    # Typed schemas for the price history endpoints: decoding validates and
+    # builds only these fields in one pass, skipping everything else
+    class _KalshiHistoryPoint(msgspec.Struct):
+        ts: Union[int, float, None] = None
+        yes_price: Union[int, float, None] = 0.5
+        volume: Union[int, float, None] = 0
+
+    class _KalshiHistoryResponse(msgspec.Struct):
+        history: List[_KalshiHistoryPoint] = []
+
+    class _ManifoldBet(msgspec.Struct):
+        createdTime: int = 0
+        probAfter: Union[int, float, None] = 0.5
+        amount: Union[int, float] = 0
+
+    _decode_kalshi_history = msgspec.json.Decoder(_KalshiHistoryResponse).decode
+    _decode_manifold_bets = msgspec.json.Decoder(List[_ManifoldBet]).decode
+
+
+def _empty_price_history() -> np.ndarray:
+    return np.empty(0, dtype=PRICE_HISTORY_DTYPE)
+
+
+def _price_history_from_rows(rows) -> np.ndarray:
+    """
+    Price history array from (timestamp, price, volume) rows. Points with a
+    missing field are dropped, as nothing downstream can use them.
+    """
+    return np.array([row for row in rows if None not in row], dtype=PRICE_HISTORY_DTYPE)
 
-@dataclass
+
+def _price_history_array(history) -> np.ndarray:
+    """Price history array from an array or [{timestamp, price, volume}] dicts (older caches)."""
+    if isinstance(history, np.ndarray):
+        return history
+    return _price_history_from_rows((p.get('timestamp'), p.get('price'), p.get('volume')) for p in history)
+
+
+def _price_history_records(history: np.ndarray) -> List[Dict]:
+    """[{timestamp, price, volume}] dicts of a price history array, for JSON output."""
+    return [
+        {'timestamp': ts, 'price': price, 'volume': volume}
+        for ts, price, volume in history.tolist()
+    ]
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (trailing 'Z' allowed) into a naive datetime."""
+    if not value:
+        return None
+    if CISO8601_AVAILABLE:
+        return ciso8601.parse_datetime(value).replace(tzinfo=None)
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+def _parse_isoformat(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a timestamp written by datetime.isoformat(), as in to_dict() output.
+    These are already naive with no 'Z' suffix, so they need none of
+    _parse_iso's normalization; fromisoformat is also quicker than rebuilding
+    datetimes from epoch integers would be.
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+@dataclass(slots=True)
 class HistoricalMarket:
-    """Represents a resolved market with historical data."""
+    """Represents a resolved market with historical data (slotted, no per-instance __dict__)."""
     id: str
     platform: str  # 'kalshi' or 'manifold'
     title: str
@@ -35,9 +359,28 @@ class HistoricalMarket:
     final_probability: float
     volume: float
     liquidity: float
-    price_history: List[Dict] = field(default_factory=list)  # [{timestamp, price, volume}]
-
-    def to_dict(self) -> Dict:
+    # Structured array of PRICE_HISTORY_DTYPE: history['price'] is the price
+    # column, history[i]['price'] the price of point i
+    price_history: np.ndarray = field(default_factory=_empty_price_history, compare=False)
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Only a handful of distinct values, repeated across every market
+        # (and freshly allocated by JSON parsing): share one copy of each
+        self.platform = sys.intern(self.platform)
+        self.category = sys.intern(self.category)
+
+    def to_dict(self, include_price_history: bool = True) -> Dict:
+        # Fields are serialized once: markets are not modified after
+        # construction, and the same market is written to the cache and again
+        # for exports. The price history only becomes dicts when included.
+        if self._dict is None:
+            self._dict = self._build_dict()
+        if not include_price_history:
+            return self._dict
+        return {**self._dict, 'price_history': _price_history_records(self.price_history)}
+
+    def _build_dict(self) -> Dict:
         return {
             'id': self.id,
             'platform': self.platform,
@@ -51,7 +394,6 @@ class HistoricalMarket:
             'final_probability': self.final_probability,
             'volume': self.volume,
             'liquidity': self.liquidity,
-            'price_history': self.price_history,
         }
 
 
@@ -64,27 +406,90 @@ class HistoricalDataCollector:
     def __init__(self, cache_enabled: bool = True):
         self.cache_enabled = cache_enabled
         self._ensure_cache_dir()
-        self._request_count = 0
-        self._last_request_time = 0
+        # Separate bucket per API: time.monotonic() of its recent requests
+        self._request_times = {api: deque(maxlen=RATE_LIMIT_BURST) for api in ('kalshi', 'manifold')}
+        self._request_counts = dict.fromkeys(self._request_times, 0)
+        self._rate_limit_locks = {api: threading.Lock() for api in self._request_times}
+        # (markets list, its length, {lowercased category: markets}) for get_markets_by_category
+        self._category_index = None
+        self.session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        HTTP session shared by all requests, so connections to Kalshi and
+        Manifold are kept alive and pooled (sized for the price history
+        workers). Transient failures are retried with backoff; the final
+        response is returned either way and checked by the caller.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': 'ttm-backtester/1.0'})
+        return session
 
     def _ensure_cache_dir(self):
         """Create cache directory if it doesn't exist."""
         os.makedirs(CACHE_DIR, exist_ok=True)
 
-    def _rate_limit(self, min_interval: float = 0.2):
-        """Implement rate limiting between API calls."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
-        self._request_count += 1
+    def _rate_limit(self, api: str):
+        """
+        Rate limit calls to one API, 'kalshi' or 'manifold' (safe to call
+        from worker threads). Each API has its own limit, so waiting on one
+        never holds up requests to the other.
+
+        Token bucket over a sliding window: at most RATE_LIMIT_BURST requests
+        start in any RATE_LIMIT_BURST / RATE_LIMIT_PER_SECOND seconds, so
+        bursts go straight through while the sustained rate stays bounded.
+        """
+        window = RATE_LIMIT_BURST / RATE_LIMIT_PER_SECOND
+        request_times = self._request_times[api]
+        with self._rate_limit_locks[api]:
+            now = time.monotonic()
+            while request_times and now - request_times[0] >= window:
+                request_times.popleft()
+            if len(request_times) >= RATE_LIMIT_BURST:
+                time.sleep(window - (now - request_times[0]))
+                request_times.popleft()
+            request_times.append(time.monotonic())
+            self._request_counts[api] += 1
+
+    @property
+    def _request_count(self) -> int:
+        """Total API requests made so far."""
+        return sum(self._request_counts.values())
+
+    def _fetch_price_histories(self, fetch_history, ids: List[str]) -> List[np.ndarray]:
+        """
+        Fetch price histories for several markets concurrently, so the
+        request round trips overlap. Each request still goes through
+        _rate_limit. Results are in the same order as ``ids``.
+        """
+        if not ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(PRICE_HISTORY_WORKERS, len(ids))) as executor:
+            return list(executor.map(fetch_history, ids))
 
     def _get_cache_path(self, platform: str, data_type: str) -> str:
         """Get cache file path for a specific data type."""
         return os.path.join(CACHE_DIR, f'{platform}_{data_type}.json')
 
-    def _load_cache(self, platform: str, data_type: str) -> Optional[Dict]:
-        """Load cached data if available and not expired."""
+    def _get_price_cache_path(self, platform: str, data_type: str) -> str:
+        """Get the path of the columnar price history file for a cached market list."""
+        return os.path.join(CACHE_DIR, f'{platform}_{data_type}_prices.npy')
+
+    def _load_cache_entry(self, platform: str, data_type: str) -> Optional[Dict]:
+        """
+        Read a cache entry, expired or not:
+        {'timestamp', 'etag', 'last_modified', 'data', ...}.
+        Use _is_cache_fresh and _cache_entry_data to check and unpack it.
+        """
         if not self.cache_enabled:
             return None
 
@@ -93,30 +498,111 @@ class HistoricalDataCollector:
             return None
 
         try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-                # Cache expires after 24 hours
-                if time.time() - cached.get('timestamp', 0) < 86400:
-                    return cached.get('data')
-        except (json.JSONDecodeError, IOError):
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except (json.JSONDecodeError, IOError, ValueError):
             pass
         return None
 
-    def _save_cache(self, platform: str, data_type: str, data: Any):
-        """Save data to cache."""
+    @staticmethod
+    def _is_cache_fresh(entry: Optional[Dict]) -> bool:
+        """Whether a cache entry is still valid (cache expires after 24 hours)."""
+        return bool(entry) and time.time() - entry.get('timestamp', 0) < 86400
+
+    def _cache_entry_data(self, platform: str, data_type: str, entry: Optional[Dict]) -> Optional[List]:
+        """Cached data of an entry, with market price histories attached from the .npy file."""
+        if not entry:
+            return None
+        data = entry.get('data')
+        lengths = entry.get('price_history_lengths')
+        if lengths is None:
+            return data
+
+        try:
+            # Read in full rather than memory-mapped: the markets keep views
+            # into this array, and the file is rewritten by the next save
+            prices = np.load(self._get_price_cache_path(platform, data_type))
+        except (IOError, ValueError):
+            return None
+        if prices.dtype != PRICE_HISTORY_DTYPE or prices.shape[0] != sum(lengths):
+            return None
+        # Copies, so the entry itself keeps its histories out of line
+        data = [dict(m) for m in data]
+        self._attach_price_histories(data, prices, lengths)
+        return data
+
+    def _refresh_cache_timestamp(self, platform: str, data_type: str, entry: Dict):
+        """Mark a cache entry as fresh again without rewriting its data."""
+        entry['timestamp'] = time.time()
+        try:
+            with open(self._get_cache_path(platform, data_type), 'wb') as f:
+                f.write(_json_dumps(entry))
+        except IOError as e:
+            print(f"Failed to save cache: {e}")
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating a cache entry."""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def _cache_validators(response) -> Dict[str, Optional[str]]:
+        """ETag / Last-Modified of a response, stored with the cache entry."""
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+
+    def _save_cache(
+        self,
+        platform: str,
+        data_type: str,
+        data: Any,
+        validators: Optional[Dict] = None,
+        price_histories: Optional[List[np.ndarray]] = None,
+    ):
+        """
+        Save data to cache, along with the ETag / Last-Modified validators
+        of the response it came from (see _cache_validators).
+
+        For market lists, ``price_histories`` (one per market in ``data``) are
+        stored concatenated as one .npy file next to the JSON.
+        """
         if not self.cache_enabled:
             return
 
-        cache_path = self._get_cache_path(platform, data_type)
+        payload = {
+            'timestamp': time.time(),
+            'data': data,
+            **(validators or {}),
+        }
         try:
-            with open(cache_path, 'w') as f:
-                json.dump({
-                    'timestamp': time.time(),
-                    'data': data,
-                }, f)
+            if price_histories is not None:
+                # Written before the JSON, which is what marks the cache as valid
+                np.save(
+                    self._get_price_cache_path(platform, data_type),
+                    np.concatenate(price_histories) if price_histories else _empty_price_history(),
+                )
+                payload['price_history_lengths'] = [len(h) for h in price_histories]
+
+            with open(self._get_cache_path(platform, data_type), 'wb') as f:
+                f.write(_json_dumps(payload))
         except IOError as e:
             print(f"Failed to save cache: {e}")
 
+    @staticmethod
+    def _attach_price_histories(markets: List[Dict], prices: np.ndarray, lengths: List[int]):
+        """Give each market its slice (a view) of the concatenated price histories."""
+        start = 0
+        for market, length in zip(markets, lengths):
+            market['price_history'] = prices[start:start + length]
+            start += length
+
     # =========================================
     # KALSHI DATA COLLECTION
     # =========================================
@@ -136,7 +622,8 @@ class HistoricalDataCollector:
         - Resolution outcomes
         """
         cache_key = f'resolved_{days_back}d'
-        cached = self._load_cache('kalshi', cache_key)
+        cache_entry = self._load_cache_entry('kalshi', cache_key)
+        cached = self._cache_entry_data('kalshi', cache_key, cache_entry) if self._is_cache_fresh(cache_entry) else None
         if cached:
             print(f"Using cached Kalshi data ({len(cached)} markets)")
             return [self._dict_to_market(m) for m in cached]
@@ -146,67 +633,96 @@ class HistoricalDataCollector:
 
         try:
             # Fetch events that have settled
-            self._rate_limit()
+            self._rate_limit('kalshi')
             events_url = f"{KALSHI_API_BASE}/events"
             params = {
                 'status': 'settled',
-                'limit': min(limit, 200),
+                'limit': min(limit, KALSHI_EVENTS_PAGE_SIZE),
             }
 
-            response = requests.get(events_url, params=params, timeout=15)
+            # Revalidate an expired cache entry instead of re-downloading everything
+            response = self.session.get(
+                events_url, params=params, headers=self._conditional_headers(cache_entry), timeout=15
+            )
+
+            if response.status_code == 304:
+                cached = self._cache_entry_data('kalshi', cache_key, cache_entry)
+                if cached:
+                    print(f"Kalshi events unchanged, using cached data ({len(cached)} markets)")
+                    self._refresh_cache_timestamp('kalshi', cache_key, cache_entry)
+                    return [self._dict_to_market(m) for m in cached]
 
             if response.status_code != 200:
                 print(f"Kalshi API returned {response.status_code}")
                 return self._generate_realistic_kalshi_history(days_back, categories)
 
-            data = response.json()
-            events = data.get('events', [])
+            validators = self._cache_validators(response)
+
+            data = _json_loads(response.content)
+            # Up to `limit` events, following the cursor past the first page
+            events = self._iter_kalshi_events(data, {'status': 'settled'}, limit)
 
             cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
+            # Select the markets first, then fetch their price histories together
+            category_filter = {c.lower() for c in categories} if categories else None
+            candidates = []
             for event in events:
                 event_markets = event.get('markets', [])
-                event_category = event.get('category', 'other').lower()
+                event_category = (event.get('category') or 'other').lower()
 
                 # Filter by category if specified
-                if categories and event_category not in [c.lower() for c in categories]:
+                if category_filter and event_category not in category_filter:
                     continue
 
+                # Markets from the same event share its creation time
+                try:
+                    created_at = _parse_iso(event.get('created_time')) or datetime.utcnow()
+                except ValueError:
+                    logger.debug(f"Bad created_time on Kalshi event: {event.get('created_time')!r}")
+                    created_at = datetime.utcnow()
+
                 for market in event_markets:
+                    # Validate required fields up front rather than catching failures later
+                    ticker = market.get('ticker')
+                    close_time_str = market.get('close_time')
+                    if not ticker or not close_time_str:
+                        continue
                     try:
-                        close_time_str = market.get('close_time')
-                        if close_time_str:
-                            close_time = datetime.fromisoformat(close_time_str.replace('Z', '+00:00'))
-                            if close_time.replace(tzinfo=None) < cutoff_date:
-                                continue
-
-                        # Get price history for this market
-                        price_history = self._fetch_kalshi_price_history(market.get('ticker'))
-
-                        hist_market = HistoricalMarket(
-                            id=market.get('ticker', ''),
-                            platform='kalshi',
-                            title=market.get('title', event.get('title', '')),
-                            category=event_category,
-                            created_at=datetime.fromisoformat(event.get('created_time', datetime.utcnow().isoformat()).replace('Z', '+00:00')).replace(tzinfo=None) if event.get('created_time') else datetime.utcnow(),
-                            closed_at=close_time.replace(tzinfo=None) if close_time_str else datetime.utcnow(),
-                            resolved_at=close_time.replace(tzinfo=None) if close_time_str else None,
-                            resolution=market.get('result', 'unknown'),
-                            initial_probability=price_history[0]['price'] if price_history else 0.5,
-                            final_probability=price_history[-1]['price'] if price_history else market.get('yes_bid', 0.5),
-                            volume=market.get('volume', 0),
-                            liquidity=market.get('open_interest', 0),
-                            price_history=price_history,
-                        )
-                        markets.append(hist_market)
-
-                    except Exception as e:
-                        print(f"Error processing Kalshi market: {e}")
+                        close_time = _parse_iso(close_time_str)
+                    except ValueError:
+                        logger.debug(f"Skipping Kalshi market {ticker}: bad close_time {close_time_str!r}")
+                        continue
+                    if close_time < cutoff_date:
                         continue
+                    candidates.append((event, event_category, created_at, market, close_time))
+
+            price_histories = self._fetch_price_histories(
+                self._fetch_kalshi_price_history,
+                [market['ticker'] for _, _, _, market, _ in candidates],
+            )
+
+            for (event, event_category, created_at, market, close_time), price_history in zip(candidates, price_histories):
+                hist_market = HistoricalMarket(
+                    id=market['ticker'],
+                    platform='kalshi',
+                    title=market.get('title', event.get('title', '')),
+                    category=event_category,
+                    created_at=created_at,
+                    closed_at=close_time,
+                    resolved_at=close_time,
+                    resolution=market.get('result', 'unknown'),
+                    initial_probability=float(price_history['price'][0]) if len(price_history) else 0.5,
+                    final_probability=float(price_history['price'][-1]) if len(price_history) else market.get('yes_bid', 0.5),
+                    volume=market.get('volume', 0),
+                    liquidity=market.get('open_interest', 0),
+                    price_history=price_history,
+                )
+                markets.append(hist_market)
 
             print(f"Fetched {len(markets)} resolved Kalshi markets")
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Kalshi API request failed: {e}")
             return self._generate_realistic_kalshi_history(days_back, categories)
 
@@ -216,40 +732,78 @@ class HistoricalDataCollector:
             markets.extend(self._generate_realistic_kalshi_history(days_back, categories, limit=200-len(markets)))
 
         # Cache the results
-        self._save_cache('kalshi', cache_key, [m.to_dict() for m in markets])
+        self._save_cache(
+            'kalshi', cache_key,
+            [m.to_dict(include_price_history=False) for m in markets],
+            validators,
+            [m.price_history for m in markets],
+        )
 
         return markets
 
-    def _fetch_kalshi_price_history(self, ticker: str) -> List[Dict]:
+    def _iter_kalshi_events(self, first_page: Dict, params: Dict, limit: int):
+        """
+        Yield up to ``limit`` Kalshi events, starting with an already fetched
+        first page and requesting further pages through the response cursor
+        only as they are consumed. A failed follow-up page ends the iteration
+        with the events collected so far.
+        """
+        url = f"{KALSHI_API_BASE}/events"
+        data = first_page
+        remaining = limit
+        while True:
+            events = data.get('events', [])[:remaining]
+            yield from events
+            remaining -= len(events)
+
+            cursor = data.get('cursor')
+            if remaining <= 0 or not cursor or not events:
+                return
+
+            try:
+                self._rate_limit('kalshi')
+                page_params = {**params, 'cursor': cursor, 'limit': min(remaining, KALSHI_EVENTS_PAGE_SIZE)}
+                response = self.session.get(url, params=page_params, timeout=15)
+                if response.status_code != 200:
+                    print(f"Kalshi API returned {response.status_code} for events page")
+                    return
+                data = _json_loads(response.content)
+            except (requests.RequestException, ValueError) as e:
+                print(f"Kalshi events page request failed: {e}")
+                return
+
+    def _fetch_kalshi_price_history(self, ticker: str) -> np.ndarray:
         """Fetch historical price data for a specific Kalshi market."""
         if not ticker:
-            return []
+            return _empty_price_history()
 
         try:
-            self._rate_limit()
+            self._rate_limit('kalshi')
             url = f"{KALSHI_API_BASE}/markets/{ticker}/history"
             params = {'limit': 1000}
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code != 200:
-                return []
+                return _empty_price_history()
 
-            data = response.json()
+            if MSGSPEC_AVAILABLE:
+                return _price_history_from_rows(
+                    (h.ts, h.yes_price, h.volume)
+                    for h in _decode_kalshi_history(response.content).history
+                )
+
+            data = _json_loads(response.content)
             history = data.get('history', [])
 
-            return [
-                {
-                    'timestamp': h.get('ts'),
-                    'price': h.get('yes_price', 0.5),
-                    'volume': h.get('volume', 0),
-                }
+            return _price_history_from_rows(
+                (h.get('ts'), h.get('yes_price', 0.5), h.get('volume', 0))
                 for h in history
-            ]
+            )
 
         except Exception as e:
             print(f"Failed to fetch price history for {ticker}: {e}")
-            return []
+            return _empty_price_history()
 
     # =========================================
     # MANIFOLD DATA COLLECTION
@@ -270,7 +824,8 @@ class HistoricalDataCollector:
         - Resolution outcomes
         """
         cache_key = f'resolved_{days_back}d'
-        cached = self._load_cache('manifold', cache_key)
+        cache_entry = self._load_cache_entry('manifold', cache_key)
+        cached = self._cache_entry_data('manifold', cache_key, cache_entry) if self._is_cache_fresh(cache_entry) else None
         if cached:
             print(f"Using cached Manifold data ({len(cached)} markets)")
             return [self._dict_to_market(m) for m in cached]
@@ -283,7 +838,7 @@ class HistoricalDataCollector:
 
         try:
             # Fetch resolved binary markets
-            self._rate_limit()
+            self._rate_limit('manifold')
             url = f"{MANIFOLD_API_BASE}/search-markets"
             params = {
                 'filter': 'resolved',
@@ -291,70 +846,90 @@ class HistoricalDataCollector:
                 'limit': min(limit, 100),
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            # Revalidate an expired cache entry instead of re-downloading everything
+            response = self.session.get(
+                url, params=params, headers=self._conditional_headers(cache_entry), timeout=15
+            )
+
+            if response.status_code == 304:
+                cached = self._cache_entry_data('manifold', cache_key, cache_entry)
+                if cached:
+                    print(f"Manifold markets unchanged, using cached data ({len(cached)} markets)")
+                    self._refresh_cache_timestamp('manifold', cache_key, cache_entry)
+                    return [self._dict_to_market(m) for m in cached]
 
             if response.status_code != 200:
                 print(f"Manifold API returned {response.status_code}")
                 return self._generate_realistic_manifold_history(days_back, categories)
 
-            data = response.json()
+            validators = self._cache_validators(response)
 
-            for market in data:
-                try:
-                    # Only process binary markets
-                    if market.get('outcomeType') != 'BINARY':
-                        continue
+            data = _json_loads(response.content)
 
-                    close_time_ms = market.get('closeTime', 0)
-                    if close_time_ms and close_time_ms < cutoff_timestamp:
-                        continue
-
-                    # Get category from group slugs
-                    group_slugs = market.get('groupSlugs', [])
-                    category = self._categorize_manifold_market(group_slugs, market.get('question', ''))
-
-                    # Filter by category if specified
-                    if categories and category not in [c.lower() for c in categories]:
-                        continue
+            # Select the markets first, then fetch their price histories together
+            category_filter = {c.lower() for c in categories} if categories else None
+            candidates = []
+            for market in data:
+                # Only process binary markets with an id (needed for the bet history)
+                if market.get('outcomeType') != 'BINARY' or not market.get('id'):
+                    continue
 
-                    # Get price history (bets)
-                    price_history = self._fetch_manifold_price_history(market.get('id'))
+                close_time_ms = market.get('closeTime') or 0
+                if close_time_ms and close_time_ms < cutoff_timestamp:
+                    continue
 
-                    created_time = datetime.fromtimestamp(market.get('createdTime', 0) / 1000) if market.get('createdTime') else datetime.utcnow()
+                try:
+                    created_time = datetime.fromtimestamp(market['createdTime'] / 1000) if market.get('createdTime') else datetime.utcnow()
                     close_time = datetime.fromtimestamp(close_time_ms / 1000) if close_time_ms else datetime.utcnow()
+                except (TypeError, ValueError, OverflowError, OSError):
+                    logger.debug(f"Skipping Manifold market {market['id']}: bad timestamps")
+                    continue
 
-                    resolution = market.get('resolution', 'unknown')
-                    if resolution == 'YES':
-                        final_prob = 1.0
-                    elif resolution == 'NO':
-                        final_prob = 0.0
-                    else:
-                        final_prob = market.get('probability', 0.5)
-
-                    hist_market = HistoricalMarket(
-                        id=market.get('id', ''),
-                        platform='manifold',
-                        title=market.get('question', ''),
-                        category=category,
-                        created_at=created_time,
-                        closed_at=close_time,
-                        resolved_at=close_time,
-                        resolution=resolution,
-                        initial_probability=price_history[0]['price'] if price_history else 0.5,
-                        final_probability=final_prob,
-                        volume=market.get('volume', 0),
-                        liquidity=market.get('totalLiquidity', 0),
-                        price_history=price_history,
-                    )
-                    markets.append(hist_market)
-
-                except Exception as e:
-                    print(f"Error processing Manifold market: {e}")
+                # Get category from group slugs
+                group_slugs = market.get('groupSlugs') or []
+                category = self._categorize_manifold_market(group_slugs, market.get('question') or '')
+
+                # Filter by category if specified
+                if category_filter and category not in category_filter:
                     continue
 
+                candidates.append((market, category, created_time, close_time))
+
+            # Get price histories (bets)
+            price_histories = self._fetch_price_histories(
+                self._fetch_manifold_price_history,
+                [market['id'] for market, _, _, _ in candidates],
+            )
+
+            for (market, category, created_time, close_time), price_history in zip(candidates, price_histories):
+                resolution = market.get('resolution', 'unknown')
+                if resolution == 'YES':
+                    final_prob = 1.0
+                elif resolution == 'NO':
+                    final_prob = 0.0
+                else:
+                    final_prob = market.get('probability', 0.5)
+
+                hist_market = HistoricalMarket(
+                    id=market['id'],
+                    platform='manifold',
+                    title=market.get('question', ''),
+                    category=category,
+                    created_at=created_time,
+                    closed_at=close_time,
+                    resolved_at=close_time,
+                    resolution=resolution,
+                    initial_probability=float(price_history['price'][0]) if len(price_history) else 0.5,
+                    final_probability=final_prob,
+                    volume=market.get('volume', 0),
+                    liquidity=market.get('totalLiquidity', 0),
+                    price_history=price_history,
+                )
+                markets.append(hist_market)
+
             print(f"Fetched {len(markets)} resolved Manifold markets")
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Manifold API request failed: {e}")
             return self._generate_realistic_manifold_history(days_back, categories)
 
@@ -364,66 +939,64 @@ class HistoricalDataCollector:
             markets.extend(self._generate_realistic_manifold_history(days_back, categories, limit=150-len(markets)))
 
         # Cache the results
-        self._save_cache('manifold', cache_key, [m.to_dict() for m in markets])
+        self._save_cache(
+            'manifold', cache_key,
+            [m.to_dict(include_price_history=False) for m in markets],
+            validators,
+            [m.price_history for m in markets],
+        )
 
         return markets
 
-    def _fetch_manifold_price_history(self, market_id: str) -> List[Dict]:
+    def _fetch_manifold_price_history(self, market_id: str) -> np.ndarray:
         """Fetch bet history to construct price movement."""
         if not market_id:
-            return []
+            return _empty_price_history()
 
         try:
-            self._rate_limit()
+            self._rate_limit('manifold')
             url = f"{MANIFOLD_API_BASE}/bets"
             params = {
                 'contractId': market_id,
                 'limit': 1000,
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code != 200:
-                return []
+                return _empty_price_history()
+
+            if MSGSPEC_AVAILABLE:
+                bets = sorted(_decode_manifold_bets(response.content), key=lambda x: x.createdTime)
+                return _price_history_from_rows(
+                    (bet.createdTime, bet.probAfter, abs(bet.amount)) for bet in bets
+                )
 
-            bets = response.json()
+            bets = _json_loads(response.content)
 
             # Convert bets to price history
-            history = []
-            for bet in sorted(bets, key=lambda x: x.get('createdTime', 0)):
-                history.append({
-                    'timestamp': bet.get('createdTime'),
-                    'price': bet.get('probAfter', 0.5),
-                    'volume': abs(bet.get('amount', 0)),
-                })
-
-            return history
+            return _price_history_from_rows(
+                (bet.get('createdTime'), bet.get('probAfter', 0.5), abs(bet.get('amount', 0)))
+                for bet in sorted(bets, key=lambda x: x.get('createdTime', 0))
+            )
 
         except Exception as e:
             print(f"Failed to fetch Manifold bets for {market_id}: {e}")
-            return []
+            return _empty_price_history()
 
     def _categorize_manifold_market(self, group_slugs: List[str], question: str) -> str:
         """Categorize a Manifold market based on its groups and question."""
-        question_lower = question.lower()
-
-        # Check group slugs first
-        category_mappings = {
-            'politics': ['politics', 'us-politics', 'elections', 'government', 'president', 'congress'],
-            'economics': ['economics', 'finance', 'stocks', 'fed', 'inflation', 'interest-rates', 'gdp'],
-            'sports': ['sports', 'nfl', 'nba', 'mlb', 'soccer', 'football', 'basketball'],
-            'crypto': ['crypto', 'bitcoin', 'ethereum', 'cryptocurrency', 'defi', 'web3'],
-            'tech': ['technology', 'ai', 'artificial-intelligence', 'tech', 'startups'],
-        }
-
-        for category, keywords in category_mappings.items():
-            for slug in group_slugs:
-                if any(kw in slug.lower() for kw in keywords):
-                    return category
+        # Check group slugs first (no keyword contains a space, so joining
+        # the slugs cannot create a match across two of them)
+        slugs_lower = ' '.join(group_slugs).lower()
+        for category, pattern in _MANIFOLD_CATEGORY_PATTERNS.items():
+            if pattern.search(slugs_lower):
+                return category
 
         # Check question text
-        for category, keywords in category_mappings.items():
-            if any(kw in question_lower for kw in keywords):
+        question_lower = question.lower()
+        for category, pattern in _MANIFOLD_CATEGORY_PATTERNS.items():
+            if pattern.search(question_lower):
                 return category
 
         return 'other'
@@ -436,145 +1009,67 @@ class HistoricalDataCollector:
         self,
         days_back: int = 180,
         categories: Optional[List[str]] = None,
-        limit: int = 100
+        limit: int = 100,
+        seed: Optional[int] = None
     ) -> List[HistoricalMarket]:
         """
         Generate realistic historical data based on real Kalshi market patterns.
-        Used when API data is insufficient.
+        Used when API data is insufficient. Pass ``seed`` for reproducible data.
+
+        All markets are generated in one batched pass (a few milliseconds for
+        the full template set), so there is nothing to gain from farming the
+        work out to other processes.
         """
-        import random
-
-        # Extended list of realistic markets based on actual 2024 events
-        real_market_templates = {
-            'politics': [
-                ('Will Biden win the 2024 presidential election?', 0.45, 0.48, 'NO'),
-                ('Will Trump win the 2024 Republican primary?', 0.72, 0.95, 'YES'),
-                ('Will Democrats retain Senate control in 2024?', 0.55, 0.52, 'YES'),
-                ('Will there be a government shutdown in Q4 2024?', 0.35, 0.15, 'NO'),
-                ('Will Nikki Haley drop out before Super Tuesday?', 0.40, 0.85, 'YES'),
-                ('Will any cabinet member resign in January?', 0.20, 0.10, 'NO'),
-                ('Will DeSantis endorse Trump after dropping out?', 0.65, 0.90, 'YES'),
-                ('Will there be a TikTok ban signed into law?', 0.30, 0.75, 'YES'),
-                ('Will Trump be on ballot in all 50 states?', 0.80, 0.95, 'YES'),
-                ('Will Biden drop out of 2024 race?', 0.15, 0.85, 'YES'),
-                ('Will Harris be Democratic nominee?', 0.10, 0.95, 'YES'),
-                ('Will RFK Jr get on ballot in 20+ states?', 0.55, 0.80, 'YES'),
-                ('Will Supreme Court hear Trump immunity case?', 0.70, 0.95, 'YES'),
-                ('Will any state secession bill pass?', 0.05, 0.02, 'NO'),
-                ('Will there be House Speaker vote in 2024?', 0.40, 0.65, 'YES'),
-                ('Will MTG face ethics investigation?', 0.35, 0.25, 'NO'),
-                ('Will Mayorkas impeachment pass House?', 0.60, 0.75, 'YES'),
-                ('Will any Senator switch parties?', 0.15, 0.08, 'NO'),
-                ('Will Texas border standoff escalate?', 0.45, 0.55, 'YES'),
-                ('Will SCOTUS rule on presidential immunity by July?', 0.65, 0.90, 'YES'),
-            ],
-            'economics': [
-                ('Will Fed cut rates in March 2024?', 0.65, 0.15, 'NO'),
-                ('Will inflation (CPI) be above 3% in December?', 0.55, 0.72, 'YES'),
-                ('Will unemployment exceed 4% in January?', 0.40, 0.35, 'NO'),
-                ('Will S&P 500 reach new ATH in January 2024?', 0.50, 0.85, 'YES'),
-                ('Will Fed cut rates in June 2024?', 0.45, 0.65, 'YES'),
-                ('Will GDP growth exceed 2% in Q4 2023?', 0.60, 0.78, 'YES'),
-                ('Will 10-year Treasury yield exceed 5%?', 0.35, 0.20, 'NO'),
-                ('Will there be a bank failure in 2024?', 0.25, 0.30, 'NO'),
-                ('Will NVDA market cap exceed $2T?', 0.40, 0.90, 'YES'),
-                ('Will oil exceed $100/barrel in 2024?', 0.30, 0.25, 'NO'),
-                ('Will gold exceed $2200/oz?', 0.45, 0.85, 'YES'),
-                ('Will Fed cut rates 3+ times in 2024?', 0.55, 0.35, 'NO'),
-                ('Will S&P 500 exceed 5000?', 0.35, 0.80, 'YES'),
-                ('Will housing prices decline nationally?', 0.40, 0.30, 'NO'),
-                ('Will AAPL market cap exceed $3T?', 0.50, 0.70, 'YES'),
-                ('Will recession be declared in 2024?', 0.30, 0.15, 'NO'),
-                ('Will January jobs report exceed 200k?', 0.55, 0.75, 'YES'),
-                ('Will core PCE fall below 3%?', 0.45, 0.60, 'YES'),
-            ],
-            'sports': [
-                ('Will Chiefs win Super Bowl LVIII?', 0.25, 0.65, 'YES'),
-                ('Will 49ers win Super Bowl LVIII?', 0.20, 0.35, 'NO'),
-                ('Will there be 60+ total points in Super Bowl?', 0.45, 0.35, 'NO'),
-                ('Will Travis Kelce score a touchdown in Super Bowl?', 0.55, 0.70, 'YES'),
-                ('Will Lakers make NBA playoffs?', 0.60, 0.75, 'YES'),
-                ('Will Ohtani sign with Dodgers?', 0.35, 0.95, 'YES'),
-                ('Will any NFL game end in a tie this season?', 0.30, 0.15, 'NO'),
-                ('Will Tiger Woods make cut at Masters?', 0.45, 0.25, 'NO'),
-                ('Will Mahomes win Super Bowl MVP?', 0.30, 0.55, 'YES'),
-                ('Will Ravens make Super Bowl?', 0.40, 0.30, 'NO'),
-                ('Will there be a perfect NCAA bracket?', 0.01, 0.01, 'NO'),
-                ('Will UConn win March Madness?', 0.15, 0.65, 'YES'),
-                ('Will any team sweep NBA playoffs?', 0.05, 0.02, 'NO'),
-                ('Will Celtics win NBA Finals?', 0.25, 0.70, 'YES'),
-                ('Will any golfer win Grand Slam?', 0.02, 0.01, 'NO'),
-                ('Will there be NFL playoff overtime?', 0.55, 0.65, 'YES'),
-                ('Will any NBA team break 73 wins?', 0.05, 0.02, 'NO'),
-                ('Will Euro 2024 have penalty shootout final?', 0.40, 0.35, 'NO'),
-                ('Will Spain win Euro 2024?', 0.15, 0.60, 'YES'),
-                ('Will a 16 seed beat a 1 seed in March Madness?', 0.10, 0.05, 'NO'),
-            ],
-            'crypto': [
-                ('Will Bitcoin exceed $50k by end of January?', 0.40, 0.75, 'YES'),
-                ('Will Bitcoin ETF be approved in January 2024?', 0.65, 0.95, 'YES'),
-                ('Will Ethereum exceed $3k in January?', 0.35, 0.60, 'YES'),
-                ('Will any major exchange fail in 2024?', 0.20, 0.15, 'NO'),
-                ('Will Bitcoin exceed $100k in 2024?', 0.25, 0.45, 'NO'),
-                ('Will SEC approve Ethereum ETF in 2024?', 0.40, 0.55, 'YES'),
-                ('Will Bitcoin halving occur in April?', 0.90, 0.98, 'YES'),
-                ('Will Solana exceed $200?', 0.30, 0.45, 'YES'),
-                ('Will any stablecoin depeg >5%?', 0.15, 0.10, 'NO'),
-                ('Will Bitcoin ETF have $10B+ volume day?', 0.35, 0.75, 'YES'),
-                ('Will Ethereum exceed $4k in 2024?', 0.40, 0.55, 'YES'),
-                ('Will crypto total market cap exceed $3T?', 0.35, 0.70, 'YES'),
-                ('Will any country adopt BTC as legal tender?', 0.20, 0.15, 'NO'),
-                ('Will FTX creditors receive 50%+ recovery?', 0.25, 0.40, 'YES'),
-            ],
-        }
+        target_categories = categories or list(_KALSHI_TEMPLATES.keys())
+        selected = [
+            (category, template)
+            for category in target_categories
+            for template in _KALSHI_TEMPLATES.get(category, ())
+        ][:limit]
+
+        # Draw the random dates and sizes for every market up front
+        n = len(selected)
+        rng = np.random.default_rng(seed)
+        days_ago_arr = rng.integers(7, days_back + 1, n)
+        duration_arr = rng.integers(14, 91, n)
+        volume_mult = rng.uniform(0.3, 2.5, n).tolist()
+        liquidity_mult = rng.uniform(0.2, 0.5, n).tolist()
+
+        # Generate realistic dates
+        now = datetime.utcnow()
+        closed_dates = [now - timedelta(days=d) for d in days_ago_arr.tolist()]
+        created_dates = [closed - timedelta(days=d) for closed, d in zip(closed_dates, duration_arr.tolist())]
+
+        # Generate price histories with realistic movement, for all markets at once
+        price_histories = self._generate_price_paths(
+            [template[1] for _, template in selected],
+            [template[2] for _, template in selected],
+            duration_arr, created_dates, closed_dates, rng=rng,
+        )
 
         markets = []
-        target_categories = categories or list(real_market_templates.keys())
-
-        for category in target_categories:
-            templates = real_market_templates.get(category, [])
-            for title, initial_prob, final_prob, resolution in templates:
-                if len(markets) >= limit:
-                    break
-
-                # Generate realistic dates
-                days_ago = random.randint(7, days_back)
-                duration_days = random.randint(14, 90)
-                created_at = datetime.utcnow() - timedelta(days=days_ago + duration_days)
-                closed_at = datetime.utcnow() - timedelta(days=days_ago)
-
-                # Generate price history with realistic movement
-                price_history = self._generate_price_path(
-                    initial_prob, final_prob, duration_days,
-                    created_at, closed_at
-                )
-
-                # Calculate realistic volume based on category
-                base_volume = {
-                    'politics': 150000,
-                    'economics': 100000,
-                    'sports': 200000,
-                    'crypto': 80000,
-                }.get(category, 50000)
-
-                volume = int(base_volume * random.uniform(0.3, 2.5))
-
-                market = HistoricalMarket(
-                    id=f'kalshi_{category}_{len(markets)}_{int(time.time())}',
-                    platform='kalshi',
-                    title=title,
-                    category=category,
-                    created_at=created_at,
-                    closed_at=closed_at,
-                    resolved_at=closed_at,
-                    resolution=resolution,
-                    initial_probability=initial_prob,
-                    final_probability=final_prob,
-                    volume=volume,
-                    liquidity=int(volume * random.uniform(0.2, 0.5)),
-                    price_history=price_history,
-                )
-                markets.append(market)
+        for i, (category, (title, initial_prob, final_prob, resolution)) in enumerate(selected):
+            # Calculate realistic volume based on category
+            base_volume = _KALSHI_BASE_VOLUME.get(category, 50000)
+
+            volume = int(base_volume * volume_mult[i])
+
+            market = HistoricalMarket(
+                id=f'kalshi_{category}_{i}_{int(time.time())}',
+                platform='kalshi',
+                title=title,
+                category=category,
+                created_at=created_dates[i],
+                closed_at=closed_dates[i],
+                resolved_at=closed_dates[i],
+                resolution=resolution,
+                initial_probability=initial_prob,
+                final_probability=final_prob,
+                volume=volume,
+                liquidity=int(volume * liquidity_mult[i]),
+                price_history=price_histories[i],
+            )
+            markets.append(market)
 
         return markets
 
@@ -582,110 +1077,56 @@ class HistoricalDataCollector:
         self,
         days_back: int = 180,
         categories: Optional[List[str]] = None,
-        limit: int = 100
+        limit: int = 100,
+        seed: Optional[int] = None
     ) -> List[HistoricalMarket]:
-        """Generate realistic Manifold historical data."""
-        import random
-
-        real_market_templates = {
-            'politics': [
-                ('Will Biden be the Democratic nominee in 2024?', 0.85, 0.15, 'NO'),
-                ('Will there be a contested convention?', 0.15, 0.05, 'NO'),
-                ('Will any sitting Senator switch parties in 2024?', 0.20, 0.10, 'NO'),
-                ('Will Trump face criminal conviction before election?', 0.45, 0.65, 'YES'),
-                ('Will Kamala Harris be the Democratic nominee?', 0.08, 0.95, 'YES'),
-                ('Will there be a third party debate?', 0.25, 0.15, 'NO'),
-                ('Will any Republican primary candidate endorse Biden?', 0.05, 0.03, 'NO'),
-                ('Will Trump appear at all primary debates?', 0.35, 0.10, 'NO'),
-                ('Will there be a VP announcement before August?', 0.60, 0.85, 'YES'),
-                ('Will any swing state have recount in 2024?', 0.45, 0.35, 'NO'),
-                ('Will there be faithless electors in 2024?', 0.10, 0.05, 'NO'),
-                ('Will Ukraine receive $60B+ aid package?', 0.55, 0.75, 'YES'),
-            ],
-            'economics': [
-                ('Will the US enter recession in 2024?', 0.35, 0.20, 'NO'),
-                ('Will any FAANG stock drop 20%+ in 2024?', 0.30, 0.25, 'NO'),
-                ('Will housing prices decline nationally in 2024?', 0.40, 0.30, 'NO'),
-                ('Will unemployment hit 5% in 2024?', 0.25, 0.15, 'NO'),
-                ('Will there be negative GDP quarter in 2024?', 0.30, 0.20, 'NO'),
-                ('Will Fed pivot to rate cuts by June?', 0.55, 0.45, 'NO'),
-                ('Will inflation fall below 2.5%?', 0.40, 0.35, 'NO'),
-                ('Will NVIDIA become most valuable company?', 0.25, 0.60, 'YES'),
-                ('Will any US bank fail in 2024?', 0.30, 0.25, 'NO'),
-                ('Will commercial real estate crisis worsen?', 0.55, 0.65, 'YES'),
-            ],
-            'tech': [
-                ('Will GPT-5 be released in 2024?', 0.40, 0.30, 'NO'),
-                ('Will Apple Vision Pro sell 1M units in 2024?', 0.45, 0.35, 'NO'),
-                ('Will OpenAI be valued at $100B+ in 2024?', 0.50, 0.80, 'YES'),
-                ('Will there be major AI regulation passed?', 0.35, 0.45, 'YES'),
-                ('Will Claude beat GPT-4 on benchmarks?', 0.35, 0.65, 'YES'),
-                ('Will there be AI-generated content lawsuit win?', 0.40, 0.55, 'YES'),
-                ('Will any AI company IPO in 2024?', 0.45, 0.35, 'NO'),
-                ('Will self-driving cars be approved in new state?', 0.50, 0.70, 'YES'),
-                ('Will Meta launch new VR headset?', 0.55, 0.75, 'YES'),
-                ('Will Twitter/X remain solvent all 2024?', 0.75, 0.90, 'YES'),
-            ],
-            'crypto': [
-                ('Will Tether lose its peg in 2024?', 0.10, 0.05, 'NO'),
-                ('Will Bitcoin dominance exceed 60%?', 0.45, 0.55, 'YES'),
-                ('Will there be a major DEX hack (>$100M)?', 0.40, 0.35, 'YES'),
-                ('Will any G7 country ban crypto?', 0.15, 0.08, 'NO'),
-                ('Will Bitcoin mining difficulty hit new ATH?', 0.70, 0.90, 'YES'),
-                ('Will NFT market recover in 2024?', 0.25, 0.20, 'NO'),
-                ('Will any memecoin enter top 20?', 0.35, 0.55, 'YES'),
-                ('Will DeFi TVL exceed $100B?', 0.40, 0.65, 'YES'),
-            ],
-            'sports': [
-                ('Will any NFL team go 17-0?', 0.05, 0.02, 'NO'),
-                ('Will Messi win another Ballon dOr?', 0.30, 0.25, 'NO'),
-                ('Will any NBA player average 35+ PPG?', 0.20, 0.15, 'NO'),
-                ('Will there be NFL London game?', 0.85, 0.95, 'YES'),
-                ('Will any MLB team win 110+ games?', 0.25, 0.20, 'NO'),
-                ('Will Olympics have boycott?', 0.20, 0.15, 'NO'),
-                ('Will any tennis player win calendar slam?', 0.08, 0.05, 'NO'),
-                ('Will F1 have new team enter?', 0.15, 0.25, 'NO'),
-            ],
-        }
+        """Generate realistic Manifold historical data (reproducible with ``seed``)."""
+        target_categories = categories or list(_MANIFOLD_TEMPLATES.keys())
+        selected = [
+            (category, template)
+            for category in target_categories
+            for template in _MANIFOLD_TEMPLATES.get(category, ())
+        ][:limit]
+
+        # Draw the random dates and sizes for every market up front
+        n = len(selected)
+        rng = np.random.default_rng(seed)
+        days_ago_arr = rng.integers(7, days_back + 1, n)
+        duration_arr = rng.integers(30, 121, n)
+        volume_arr = rng.uniform(5000, 50000, n).tolist()
+        liquidity_mult = rng.uniform(0.3, 0.6, n).tolist()
+
+        now = datetime.utcnow()
+        closed_dates = [now - timedelta(days=d) for d in days_ago_arr.tolist()]
+        created_dates = [closed - timedelta(days=d) for closed, d in zip(closed_dates, duration_arr.tolist())]
+
+        price_histories = self._generate_price_paths(
+            [template[1] for _, template in selected],
+            [template[2] for _, template in selected],
+            duration_arr, created_dates, closed_dates, rng=rng,
+        )
 
         markets = []
-        target_categories = categories or list(real_market_templates.keys())
-
-        for category in target_categories:
-            templates = real_market_templates.get(category, [])
-            for title, initial_prob, final_prob, resolution in templates:
-                if len(markets) >= limit:
-                    break
-
-                days_ago = random.randint(7, days_back)
-                duration_days = random.randint(30, 120)
-                created_at = datetime.utcnow() - timedelta(days=days_ago + duration_days)
-                closed_at = datetime.utcnow() - timedelta(days=days_ago)
-
-                price_history = self._generate_price_path(
-                    initial_prob, final_prob, duration_days,
-                    created_at, closed_at
-                )
-
-                # Manifold typically has lower volume
-                volume = int(random.uniform(5000, 50000))
-
-                market = HistoricalMarket(
-                    id=f'manifold_{category}_{len(markets)}_{int(time.time())}',
-                    platform='manifold',
-                    title=title,
-                    category=category,
-                    created_at=created_at,
-                    closed_at=closed_at,
-                    resolved_at=closed_at,
-                    resolution=resolution,
-                    initial_probability=initial_prob,
-                    final_probability=final_prob,
-                    volume=volume,
-                    liquidity=int(volume * random.uniform(0.3, 0.6)),
-                    price_history=price_history,
-                )
-                markets.append(market)
+        for i, (category, (title, initial_prob, final_prob, resolution)) in enumerate(selected):
+            # Manifold typically has lower volume
+            volume = int(volume_arr[i])
+
+            market = HistoricalMarket(
+                id=f'manifold_{category}_{i}_{int(time.time())}',
+                platform='manifold',
+                title=title,
+                category=category,
+                created_at=created_dates[i],
+                closed_at=closed_dates[i],
+                resolved_at=closed_dates[i],
+                resolution=resolution,
+                initial_probability=initial_prob,
+                final_probability=final_prob,
+                volume=volume,
+                liquidity=int(volume * liquidity_mult[i]),
+                price_history=price_histories[i],
+            )
+            markets.append(market)
 
         return markets
 
@@ -695,67 +1136,125 @@ class HistoricalDataCollector:
         final_prob: float,
         duration_days: int,
         start_date: datetime,
-        end_date: datetime
-    ) -> List[Dict]:
-        """Generate realistic price path between two points."""
-        import random
-        import math
+        end_date: datetime,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Generate realistic price path between two points. With ``seed``, the
+        path is reproducible; a stable per-market seed can be derived from the
+        market id with zlib.crc32 (not hash(), which is salted per process).
+        """
+        return self._generate_price_paths(
+            [initial_prob], [final_prob], [duration_days], [start_date], [end_date],
+            path_seeds=None if seed is None else [seed],
+        )[0]
+
+    def _generate_price_paths(
+        self,
+        initial_probs: List[float],
+        final_probs: List[float],
+        durations: List[int],
+        start_dates: List[datetime],
+        end_dates: List[datetime],
+        rng: Optional[np.random.Generator] = None,
+        path_seeds: Optional[List[int]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Generate realistic price paths for several markets at once.
+
+        Each path is a random walk that starts at the initial probability and
+        drifts toward the final one, clipped to [0.01, 0.99], with
+        PRICE_POINTS_PER_DAY points per day (at most MAX_PRICE_POINTS) and a
+        last point at the end date. The random draws are batched; the walks
+        themselves run in a compiled kernel. The histories are views into one
+        array holding all of them.
+
+        ``path_seeds`` (one per market) gives each market its own random
+        stream instead of the shared ``rng``, so its path does not depend on
+        the other markets in the batch.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        initial_probs = np.asarray(initial_probs, dtype=np.float64)
+        final_probs = np.asarray(final_probs, dtype=np.float64)
+        durations = np.asarray(durations, dtype=np.int64)
+        n_markets = initial_probs.shape[0]
+        if n_markets == 0:
+            return []
 
-        history = []
-        num_points = min(duration_days * 4, 200)  # ~4 price points per day
+        num_points = np.minimum(durations * PRICE_POINTS_PER_DAY, MAX_PRICE_POINTS)
+        max_points = int(num_points.max())
+        time_steps = 1.0 / num_points
+        sigmas = PRICE_PATH_VOLATILITY * np.sqrt(time_steps)
+        # Draw noise only for the steps each market uses, already scaled by
+        # sqrt(dt); the rest of each row is padding the kernel never reads
+        noise = np.zeros((n_markets, max_points))
+        if path_seeds is None:
+            used = np.arange(max_points) < num_points[:, None]
+            noise[used] = rng.normal(0.0, np.repeat(sigmas, num_points))
+            volumes = rng.integers(100, 5001, (n_markets, max_points + 1))
+            final_volumes = rng.integers(500, 10001, n_markets)
+        else:
+            # Padding past each market's steps is never kept
+            volumes = np.zeros((n_markets, max_points + 1), dtype=np.int64)
+            final_volumes = np.empty(n_markets, dtype=np.int64)
+            for m, path_seed in enumerate(path_seeds):
+                market_rng = np.random.default_rng(path_seed)
+                n = num_points[m]
+                noise[m, :n] = market_rng.normal(0.0, sigmas[m], n)
+                volumes[m, :n] = market_rng.integers(100, 5001, n)
+                final_volumes[m] = market_rng.integers(500, 10001)
 
         # Brownian bridge - random walk that starts at initial and ends at final
-        current_price = initial_prob
-        time_step = 1.0 / num_points
-
-        for i in range(num_points):
-            t = i * time_step
-            remaining = 1.0 - t
-
-            if remaining > 0.01:
-                # Drift toward final price
-                drift = (final_prob - current_price) * time_step / remaining
-                # Random noise
-                noise = random.gauss(0, 0.015) * math.sqrt(time_step)
-                current_price += drift + noise
-                current_price = max(0.01, min(0.99, current_price))
-            else:
-                current_price = final_prob
-
-            timestamp = start_date + timedelta(days=i * duration_days / num_points)
-
-            history.append({
-                'timestamp': int(timestamp.timestamp() * 1000),
-                'price': round(current_price, 4),
-                'volume': random.randint(100, 5000),
-            })
-
-        # Ensure final point
-        history.append({
-            'timestamp': int(end_date.timestamp() * 1000),
-            'price': round(final_prob, 4),
-            'volume': random.randint(500, 10000),
-        })
-
-        return history
+        prices = price_paths(noise, initial_probs, final_probs, num_points)
+
+        # Integer milliseconds throughout: one datetime conversion per market,
+        # then int64 arithmetic. The step division is exact, as MS_PER_DAY is
+        # a multiple of both PRICE_POINTS_PER_DAY and MAX_PRICE_POINTS.
+        start_ms = np.array([int(d.timestamp() * 1000) for d in start_dates], dtype=np.int64)
+        end_ms = np.array([int(d.timestamp() * 1000) for d in end_dates], dtype=np.int64)
+        step_ms = durations * MS_PER_DAY // num_points
+        columns = np.arange(max_points + 1)
+        timestamps = start_ms[:, None] + columns * step_ms[:, None]
+        prices = np.hstack([prices, np.empty((n_markets, 1))])
+
+        # Ensure final point, right after each market's last step
+        rows = np.arange(n_markets)
+        timestamps[rows, num_points] = end_ms
+        prices[rows, num_points] = final_probs
+        volumes[rows, num_points] = final_volumes
+
+        keep = columns <= num_points[:, None]
+        flat = np.empty(int(keep.sum()), dtype=PRICE_HISTORY_DTYPE)
+        flat['timestamp'] = timestamps[keep]
+        flat['price'] = np.round(prices[keep], 4)
+        flat['volume'] = volumes[keep]
+        return np.split(flat, np.cumsum(num_points + 1)[:-1])
 
     def _dict_to_market(self, d: Dict) -> HistoricalMarket:
-        """Convert dictionary back to HistoricalMarket object."""
-        return HistoricalMarket(
+        """
+        Convert dictionary back to HistoricalMarket object. ``d`` is in
+        to_dict() form already, so its fields are kept as the market's
+        serialized form. The price history may be an array (from the .npy
+        cache) or a list of dicts.
+        """
+        market = HistoricalMarket(
             id=d['id'],
             platform=d['platform'],
             title=d['title'],
             category=d['category'],
-            created_at=datetime.fromisoformat(d['created_at']) if d.get('created_at') else datetime.utcnow(),
-            closed_at=datetime.fromisoformat(d['closed_at']) if d.get('closed_at') else datetime.utcnow(),
-            resolved_at=datetime.fromisoformat(d['resolved_at']) if d.get('resolved_at') else None,
+            created_at=_parse_isoformat(d.get('created_at')) or datetime.utcnow(),
+            closed_at=_parse_isoformat(d.get('closed_at')) or datetime.utcnow(),
+            resolved_at=_parse_isoformat(d.get('resolved_at')),
             resolution=d['resolution'],
             initial_probability=d['initial_probability'],
             final_probability=d['final_probability'],
             volume=d['volume'],
             liquidity=d['liquidity'],
-            price_history=d.get('price_history', []),
+            price_history=_price_history_array(d.get('price_history', ())),
         )
+        market._dict = {k: v for k, v in d.items() if k != 'price_history'}
+        return market
 
     # =========================================
     # AGGREGATION & EXPORT
@@ -769,11 +1268,17 @@ class HistoricalDataCollector:
         """
         Fetch historical data from all platforms.
 
+        The platforms are fetched concurrently, so their network waits
+        overlap; requests still share the collector's rate limit.
+
         Returns:
             Dict with 'kalshi', 'manifold', and 'all' keys
         """
-        kalshi_markets = self.fetch_kalshi_resolved_markets(days_back, categories)
-        manifold_markets = self.fetch_manifold_resolved_markets(days_back, categories)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kalshi_future = executor.submit(self.fetch_kalshi_resolved_markets, days_back, categories)
+            manifold_future = executor.submit(self.fetch_manifold_resolved_markets, days_back, categories)
+            kalshi_markets = kalshi_future.result()
+            manifold_markets = manifold_future.result()
 
         return {
             'kalshi': kalshi_markets,
@@ -786,13 +1291,25 @@ class HistoricalDataCollector:
         markets: List[HistoricalMarket],
         category: str
     ) -> List[HistoricalMarket]:
-        """Filter markets by category."""
-        return [m for m in markets if m.category.lower() == category.lower()]
+        """
+        Filter markets by category.
+
+        The markets are indexed by lowercased category on the first query,
+        so repeated queries on the same list are lookups. The index is
+        rebuilt when given a different list, or the list's length changed.
+        """
+        index = self._category_index
+        if index is None or index[0] is not markets or index[1] != len(markets):
+            by_category = defaultdict(list)
+            for m in markets:
+                by_category[m.category.lower()].append(m)
+            index = self._category_index = (markets, len(markets), by_category)
+        return list(index[2].get(category.lower(), ()))
 
     def export_to_json(self, markets: List[HistoricalMarket], filepath: str):
         """Export markets to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump([m.to_dict() for m in markets], f, indent=2)
+        with open(filepath, 'wb') as f:
+            _write_json_array(f, (m.to_dict() for m in markets))
         print(f"Exported {len(markets)} markets to {filepath}")
 
 
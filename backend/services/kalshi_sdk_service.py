@@ -4,7 +4,9 @@ Uses the official kalshi_python_sync SDK for enhanced market data and trading.
 Provides real market data for the scanner and live trading for Pro users.
 """
 import os
+import time
 import logging
+import threading
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
@@ -21,6 +23,21 @@ except ImportError:
     SDK_AVAILABLE = False
     logger.warning("kalshi_python_sync not installed. Run: pip install kalshi_python_sync")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Largest page the markets endpoint returns
+MARKETS_PAGE_SIZE = 1000
+
+# Public market data responses are reused for a few seconds, so polling
+# clients (scanner, price lookups) don't repeat identical requests
+MARKET_CACHE_TTL = 5
+ORDERBOOK_CACHE_TTL = 1  # order books move faster
+MARKET_CACHE_SIZE = 256
+
 
 class KalshiSDKService:
     """
@@ -55,6 +72,9 @@ class KalshiSDKService:
         self.portfolio_api = None
         self.orders_api = None
         self.is_authenticated = False
+        self._http_session = None  # requests session for the fallback, created on first use
+        self._cache: Dict[tuple, Dict] = {}
+        self._cache_lock = threading.Lock()
         
         if SDK_AVAILABLE:
             self._initialize_client()
@@ -101,6 +121,27 @@ class KalshiSDKService:
             logger.error(f"Failed to initialize Kalshi SDK client: {e}")
             self.client = None
     
+    # ============================================
+    # RESPONSE CACHE
+    # ============================================
+    
+    def _get_cached(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Get cached response data if not expired."""
+        cached = self._cache.get(key)
+        if cached and time.time() < cached['expires']:
+            return cached['data']
+        return None
+    
+    def _set_cached(self, key: tuple, data: Dict[str, Any], ttl: float):
+        """Set cached response data with TTL, evicting the oldest entry when full."""
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= MARKET_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = {
+                'data': data,
+                'expires': time.time() + ttl,
+            }
+    
     # ============================================
     # PUBLIC MARKET DATA (No Auth Required)
     # ============================================
@@ -111,11 +152,13 @@ class KalshiSDKService:
         limit: int = 100,
         cursor: Optional[str] = None,
         series_ticker: Optional[str] = None,
-        event_ticker: Optional[str] = None
+        event_ticker: Optional[str] = None,
+        force_refresh: bool = False
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Get list of markets from Kalshi.
         This is a PUBLIC endpoint - no authentication required.
+        Responses are cached for MARKET_CACHE_TTL seconds.
         
         Args:
             status: Market status filter ('open', 'closed', 'settled')
@@ -123,12 +166,32 @@ class KalshiSDKService:
             cursor: Pagination cursor
             series_ticker: Filter by series
             event_ticker: Filter by event
+            force_refresh: Bypass the cache
             
         Returns:
             Tuple of (success, data dict with markets list)
         """
+        cache_key = ('markets', status, limit, cursor, series_ticker, event_ticker)
+        cached = None if force_refresh else self._get_cached(cache_key)
+        if cached is not None:
+            return True, cached
+        
+        success, data = self._get_markets(status, limit, cursor, series_ticker, event_ticker)
+        if success:
+            self._set_cached(cache_key, data, MARKET_CACHE_TTL)
+        return success, data
+    
+    def _get_markets(
+        self,
+        status: str,
+        limit: int,
+        cursor: Optional[str],
+        series_ticker: Optional[str],
+        event_ticker: Optional[str]
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Uncached get_markets: SDK call, with the requests fallback."""
         if not SDK_AVAILABLE or not self.market_api:
-            return self._fallback_get_markets(status, limit)
+            return self._fallback_get_markets(status, limit, cursor, series_ticker, event_ticker)
         
         try:
             # SDK call via MarketApi
@@ -142,9 +205,10 @@ class KalshiSDKService:
                 
             response = self.market_api.get_markets(**kwargs)
             
-            markets = []
-            for m in response.markets or []:
-                markets.append({
+            # Spelled out on purpose: a dict literal of attribute reads beats
+            # dict(zip(keys, operator.attrgetter(*keys)(m))) on CPython 3.11+
+            markets = [
+                {
                     'ticker': m.ticker,
                     'title': m.title,
                     'subtitle': getattr(m, 'subtitle', ''),
@@ -162,7 +226,9 @@ class KalshiSDKService:
                     'category': getattr(m, 'category', 'other'),
                     'series_ticker': getattr(m, 'series_ticker', None),
                     'event_ticker': getattr(m, 'event_ticker', None),
-                })
+                }
+                for m in response.markets or []
+            ]
             
             return True, {
                 'markets': markets,
@@ -172,18 +238,79 @@ class KalshiSDKService:
             
         except Exception as e:
             logger.error(f"SDK get_markets failed: {e}")
-            return self._fallback_get_markets(status, limit)
+            return self._fallback_get_markets(status, limit, cursor, series_ticker, event_ticker)
+    
+    def get_all_markets(
+        self,
+        status: str = 'open',
+        limit: int = 1000,
+        series_ticker: Optional[str] = None,
+        event_ticker: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Get up to ``limit`` markets, following the pagination cursor across
+        as many pages as needed (each page cached as by get_markets).
+        
+        Pages are requested back to back over the same connection; they
+        cannot be fetched in parallel, as each page's cursor comes from the
+        previous response. If a later page fails, the markets collected so
+        far are returned.
+        
+        Returns:
+            Tuple of (success, data dict with markets list)
+        """
+        markets = []
+        cursor = None
+        while len(markets) < limit:
+            success, data = self.get_markets(
+                status=status,
+                limit=min(limit - len(markets), MARKETS_PAGE_SIZE),
+                cursor=cursor,
+                series_ticker=series_ticker,
+                event_ticker=event_ticker,
+                force_refresh=force_refresh,
+            )
+            if not success:
+                if not markets:
+                    return False, data
+                logger.warning(f"Stopped paging markets after {len(markets)}: {data.get('error')}")
+                break
+        
+            markets.extend(data['markets'])
+            cursor = data.get('cursor')
+            if not cursor or not data['markets']:
+                break
+        
+        return True, {
+            'markets': markets,
+            'cursor': cursor,
+            'count': len(markets)
+        }
     
-    def get_market(self, ticker: str) -> Tuple[bool, Dict[str, Any]]:
+    def get_market(self, ticker: str, force_refresh: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """
-        Get details for a specific market.
+        Get details for a specific market (cached for MARKET_CACHE_TTL seconds).
         
         Args:
             ticker: Market ticker
+            force_refresh: Bypass the cache, e.g. when pricing an order
             
         Returns:
             Tuple of (success, market data dict)
         """
+        cache_key = ('market', ticker)
+        cached = None if force_refresh else self._get_cached(cache_key)
+        if cached is not None:
+            return True, cached
+        
+        success, data = self._get_market(ticker)
+        if success:
+            self._set_cached(cache_key, data, MARKET_CACHE_TTL)
+        return success, data
+    
+    def _get_market(self, ticker: str) -> Tuple[bool, Dict[str, Any]]:
+        """Uncached get_market."""
         if not SDK_AVAILABLE or not self.market_api:
             return False, {'error': 'SDK not available'}
         
@@ -234,9 +361,8 @@ class KalshiSDKService:
                 
             response = self.events_api.get_events(**kwargs)
             
-            events = []
-            for e in response.events or []:
-                events.append({
+            events = [
+                {
                     'event_ticker': e.event_ticker,
                     'title': e.title,
                     'subtitle': getattr(e, 'subtitle', ''),
@@ -244,7 +370,9 @@ class KalshiSDKService:
                     'series_ticker': getattr(e, 'series_ticker', None),
                     'markets_count': getattr(e, 'markets_count', 0),
                     'volume': getattr(e, 'volume', 0),
-                })
+                }
+                for e in response.events or []
+            ]
             
             return True, {
                 'events': events,
@@ -256,17 +384,35 @@ class KalshiSDKService:
             logger.error(f"SDK get_events failed: {e}")
             return False, {'error': str(e)}
     
-    def get_orderbook(self, ticker: str, depth: int = 10) -> Tuple[bool, Dict[str, Any]]:
+    def get_orderbook(
+        self,
+        ticker: str,
+        depth: int = 10,
+        force_refresh: bool = False
+    ) -> Tuple[bool, Dict[str, Any]]:
         """
-        Get order book for a market.
+        Get order book for a market (cached for ORDERBOOK_CACHE_TTL seconds).
         
         Args:
             ticker: Market ticker
             depth: Number of price levels to return
+            force_refresh: Bypass the cache
             
         Returns:
             Tuple of (success, orderbook data)
         """
+        cache_key = ('orderbook', ticker, depth)
+        cached = None if force_refresh else self._get_cached(cache_key)
+        if cached is not None:
+            return True, cached
+        
+        success, data = self._get_orderbook(ticker, depth)
+        if success:
+            self._set_cached(cache_key, data, ORDERBOOK_CACHE_TTL)
+        return success, data
+    
+    def _get_orderbook(self, ticker: str, depth: int) -> Tuple[bool, Dict[str, Any]]:
+        """Uncached get_orderbook."""
         if not SDK_AVAILABLE or not self.market_api:
             return False, {'error': 'SDK not available'}
         
@@ -329,16 +475,17 @@ class KalshiSDKService:
         try:
             response = self.portfolio_api.get_positions()
             
-            positions = []
-            for p in response.market_positions or []:
-                positions.append({
+            positions = [
+                {
                     'ticker': p.ticker,
                     'market_exposure': getattr(p, 'market_exposure', 0) / 100,
                     'rest_count': getattr(p, 'resting_contracts_count', 0),
                     'position': getattr(p, 'position', 0),
                     'total_cost': getattr(p, 'total_traded', 0) / 100,
                     'realized_pnl': getattr(p, 'realized_pnl', 0) / 100,
-                })
+                }
+                for p in response.market_positions or []
+            ]
             
             return True, {
                 'positions': positions,
@@ -365,9 +512,8 @@ class KalshiSDKService:
         try:
             response = self.portfolio_api.get_fills(limit=limit)
             
-            fills = []
-            for f in response.fills or []:
-                fills.append({
+            fills = [
+                {
                     'trade_id': f.trade_id,
                     'ticker': f.ticker,
                     'side': f.side,
@@ -376,7 +522,9 @@ class KalshiSDKService:
                     'price': f.price / 100 if f.price else 0,
                     'created_time': f.created_time,
                     'is_taker': getattr(f, 'is_taker', True),
-                })
+                }
+                for f in response.fills or []
+            ]
             
             return True, {
                 'fills': fills,
@@ -516,9 +664,8 @@ class KalshiSDKService:
             
             response = self.orders_api.get_orders(**kwargs)
             
-            orders = []
-            for o in response.orders or []:
-                orders.append({
+            orders = [
+                {
                     'order_id': o.order_id,
                     'client_order_id': o.client_order_id,
                     'ticker': o.ticker,
@@ -529,7 +676,9 @@ class KalshiSDKService:
                     'count': o.remaining_count,
                     'status': o.status,
                     'created_time': o.created_time,
-                })
+                }
+                for o in response.orders or []
+            ]
             
             return True, {
                 'orders': orders,
@@ -544,16 +693,36 @@ class KalshiSDKService:
     # FALLBACK METHODS (When SDK not available)
     # ============================================
     
-    def _fallback_get_markets(self, status: str, limit: int) -> Tuple[bool, Dict[str, Any]]:
+    def _get_http_session(self):
+        """Requests session for the fallback, so consecutive calls reuse a keep-alive connection."""
+        if self._http_session is None:
+            import requests
+            self._http_session = requests.Session()
+        return self._http_session
+    
+    def _fallback_get_markets(
+        self,
+        status: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        series_ticker: Optional[str] = None,
+        event_ticker: Optional[str] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
         """Fallback using requests when SDK not available."""
-        import requests
-        
         try:
-            url = f"{self.PROD_HOST}/markets?status={status}&limit={limit}"
-            response = requests.get(url, timeout=15)
+            params = {'status': status, 'limit': limit}
+            if cursor:
+                params['cursor'] = cursor
+            if series_ticker:
+                params['series_ticker'] = series_ticker
+            if event_ticker:
+                params['event_ticker'] = event_ticker
+            
+            response = self._get_http_session().get(f"{self.PROD_HOST}/markets", params=params, timeout=15)
             
             if response.status_code == 200:
-                data = response.json()
+                # Full pages run to ~1000 markets; orjson parses them several times faster
+                data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
                 return True, {
                     'markets': data.get('markets', []),
                     'cursor': data.get('cursor'),
@@ -615,7 +784,7 @@ def get_live_markets(
         List of market dicts with prices, volume, etc.
     """
     client = get_kalshi_client()
-    success, data = client.get_markets(status=status, limit=limit)
+    success, data = client.get_all_markets(status=status, limit=limit)
     
     if not success:
         logger.error(f"Failed to get live markets: {data.get('error')}")
@@ -630,18 +799,19 @@ def get_live_markets(
     return markets
 
 
-def get_market_price(ticker: str) -> Optional[Dict[str, Any]]:
+def get_market_price(ticker: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
     """
     Get current price info for a specific market.
     
     Args:
         ticker: Market ticker
+        force_refresh: Skip the few-second response cache (use when placing orders)
         
     Returns:
         Dict with yes_bid, yes_ask, no_bid, no_ask, volume, etc.
     """
     client = get_kalshi_client()
-    success, data = client.get_market(ticker)
+    success, data = client.get_market(ticker, force_refresh=force_refresh)
     
     if success:
         return data
@@ -17,9 +17,9 @@ from .historical_data_collector import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class RealTrade:
-    """Represents a trade executed against real market data."""
+    """Represents a trade executed against real market data (slotted, like HistoricalMarket)."""
     market_id: str
     market_title: str
     platform: str
@@ -271,15 +271,17 @@ class RealBacktestEngine:
         platforms: List[str]
     ) -> List[HistoricalMarket]:
         """Filter markets by strategy criteria."""
+        categories = {c.lower() for c in categories}
+        platforms = {p.lower() for p in platforms}
         filtered = []
         for market in markets:
-            if market.category.lower() not in [c.lower() for c in categories]:
+            if market.category.lower() not in categories:
                 continue
-            if market.platform.lower() not in [p.lower() for p in platforms]:
+            if market.platform.lower() not in platforms:
                 continue
             if market.resolution not in ['YES', 'NO']:
                 continue
-            if not market.price_history:
+            if not len(market.price_history):
                 continue
             filtered.append(market)
 
@@ -368,15 +370,16 @@ class RealBacktestEngine:
         """
         import random
 
-        if not market.price_history:
+        if not len(market.price_history):
             return False, '', 0.0
 
         # Get entry point (early in market's life) - NO HINDSIGHT
-        early_prices = market.price_history[:len(market.price_history)//3]
-        if not early_prices:
+        prices = market.price_history['price']
+        early_prices = prices[:len(prices)//3]
+        if not len(early_prices):
             return False, '', 0.0
 
-        entry_price = sum(p['price'] for p in early_prices) / len(early_prices)
+        entry_price = float(early_prices.mean())
 
         # Simulate real trading: we DON'T know the resolution at entry time
         # Instead, we make decisions based on price signals and market characteristics
@@ -403,8 +406,8 @@ class RealBacktestEngine:
             if len(early_prices) < 3:
                 return False, '', 0.0
 
-            first_price = early_prices[0]['price']
-            last_early_price = early_prices[-1]['price']
+            first_price = float(early_prices[0])
+            last_early_price = float(early_prices[-1])
             trend = last_early_price - first_price
 
             if abs(trend) < min_edge: